@@ -35,7 +35,7 @@ Usage:
 import logging
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo.errors import OperationFailure
@@ -106,6 +106,7 @@ class AuthAuditLog:
         self,
         mongo_db: AsyncIOMotorDatabase,
         retention_days: int = DEFAULT_RETENTION_DAYS,
+        clock: Optional[Callable[[], datetime]] = None,
     ):
         """
         Initialize the audit logger.
@@ -113,10 +114,12 @@ class AuthAuditLog:
         Args:
             mongo_db: MongoDB database instance
             retention_days: How long to keep audit logs (default: 90 days)
+            clock: Returns the current UTC time (defaults to datetime.utcnow)
         """
         self._db = mongo_db
         self._collection = mongo_db[AUDIT_COLLECTION]
         self._retention_days = retention_days
+        self._clock = clock or datetime.utcnow
         self._indexes_created = False
 
         logger.info(f"AuthAuditLog initialized (retention: {retention_days} days)")
@@ -186,7 +189,7 @@ class AuthAuditLog:
         """
         await self.ensure_indexes()
 
-        now = datetime.utcnow()
+        now = self._clock()
         expires_at = now + timedelta(days=self._retention_days)
 
         doc = {
@@ -365,7 +368,7 @@ class AuthAuditLog:
         Returns:
             List of audit event documents
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
+        since = self._clock() - timedelta(hours=hours)
 
         query: Dict[str, Any] = {"timestamp": {"$gte": since}}
         if action:
@@ -401,7 +404,7 @@ class AuthAuditLog:
         Returns:
             List of failed login events
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
+        since = self._clock() - timedelta(hours=hours)
 
         query: Dict[str, Any] = {
             "action": AuthAction.LOGIN_FAILED.value,
@@ -437,7 +440,7 @@ class AuthAuditLog:
         Returns:
             List of user's audit events
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
+        since = self._clock() - timedelta(hours=hours)
 
         cursor = (
             self._collection.find(
@@ -476,7 +479,7 @@ class AuthAuditLog:
         Returns:
             List of audit events from that IP
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
+        since = self._clock() - timedelta(hours=hours)
 
         cursor = (
             self._collection.find(
@@ -515,7 +518,7 @@ class AuthAuditLog:
         Returns:
             Number of failed login attempts
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
+        since = self._clock() - timedelta(hours=hours)
 
         query: Dict[str, Any] = {
             "action": AuthAction.LOGIN_FAILED.value,
@@ -541,7 +544,7 @@ class AuthAuditLog:
         Returns:
             Dict with security metrics
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
+        since = self._clock() - timedelta(hours=hours)
 
         # Use aggregation for efficient counting
         pipeline = [
@@ -81,6 +81,7 @@ def validate_csrf_token(
     token: str,
     secret: Optional[str] = None,
     max_age: int = DEFAULT_TOKEN_TTL,
+    now: Optional[float] = None,
 ) -> bool:
     """
     Validate a CSRF token.
@@ -89,6 +90,7 @@ def validate_csrf_token(
         token: The token to validate
         secret: Optional secret for HMAC verification
         max_age: Maximum token age in seconds
+        now: Current Unix time for the age check (defaults to time.time())
 
     Returns:
         True if valid, False otherwise
@@ -107,7 +109,9 @@ def validate_csrf_token(
             timestamp = int(timestamp_str)
 
             # Check age
-            if time.time() - timestamp > max_age:
+            if now is None:
+                now = time.time()
+            if now - timestamp > max_age:
                 logger.debug("CSRF token expired")
                 return False
 
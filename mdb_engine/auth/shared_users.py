@@ -52,6 +52,8 @@ import jwt
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo.errors import OperationFailure, PyMongoError
 
+from ..config import get_bcrypt_rounds
+
 if TYPE_CHECKING:
     from fastapi import Request
 
@@ -309,7 +311,9 @@ class SharedUserPool:
             raise ValueError(f"User with email '{email}' already exists")
 
         # Hash password
-        password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        password_hash = bcrypt.hashpw(
+            password.encode("utf-8"), bcrypt.gensalt(rounds=get_bcrypt_rounds())
+        ).decode("utf-8")
 
         now = datetime.utcnow()
         user_doc = {
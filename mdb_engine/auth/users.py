@@ -35,6 +35,7 @@ except ImportError:
     OperationFailure = Exception
     ServerSelectionTimeoutError = Exception
 
+from ..config import get_bcrypt_rounds
 from .dependencies import SECRET_KEY
 
 logger = logging.getLogger(__name__)
@@ -533,7 +534,9 @@ async def create_app_user(
 
         # Always hash password (plain text support removed for security)
         try:
-            password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+            password_hash = bcrypt.hashpw(
+                password.encode("utf-8"), bcrypt.gensalt(rounds=get_bcrypt_rounds())
+            )
         except (ValueError, TypeError, UnicodeEncodeError):
             logger.exception("Error encoding password for hashing")
             return None
@@ -715,7 +718,9 @@ async def _link_platform_demo_user(
         platform_password = platform_demo.get("password", "demo123")
         password_hash = None
         try:
-            password_hash = bcrypt.hashpw(platform_password.encode("utf-8"), bcrypt.gensalt())
+            password_hash = bcrypt.hashpw(
+                platform_password.encode("utf-8"), bcrypt.gensalt(rounds=get_bcrypt_rounds())
+            )
         except (ValueError, TypeError, AttributeError) as e:
             logger.error(
                 f"Error hashing password for platform demo user " f"{platform_demo['email']}: {e}",
@@ -844,7 +849,9 @@ async def _create_demo_user_from_config(
 
     # Hash password with bcrypt
     try:
-        password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+        password_hash = bcrypt.hashpw(
+            password.encode("utf-8"), bcrypt.gensalt(rounds=get_bcrypt_rounds())
+        )
     except (ValueError, TypeError, AttributeError) as e:
         logger.error(f"Error hashing password for demo user {email}: {e}", exc_info=True)
         return None
@@ -17,6 +17,7 @@ import bcrypt
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse, RedirectResponse
 
+from ..config import get_bcrypt_rounds
 from .cookie_utils import clear_auth_cookies, set_auth_cookies
 from .dependencies import SECRET_KEY, get_session_manager, get_token_blacklist
 from .jwt import generate_token_pair
@@ -588,7 +589,9 @@ async def _create_user_document(
     email: str, password: str, extra_data: Optional[Dict[str, Any]]
 ) -> Dict[str, Any]:
     """Create user document with hashed password."""
-    password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    password_hash = bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=get_bcrypt_rounds())
+    )
     user_doc = {
         "email": email,
         "password_hash": password_hash,
@@ -16,6 +16,7 @@ This module is part of MDB_ENGINE - MongoDB Engine.
 """
 
 import json
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -403,6 +404,75 @@ class AppGenerator:
 """
 
 
+# --- Manifest Builder ---
+
+# Same pattern as the manifest schema's "slug" property; compiled once at import
+_SLUG_RE = re.compile(r"[a-z0-9_-]+")
+
+
+def _validate_slug(slug: str) -> None:
+    """Raise a ClickException if the slug is not lowercase alphanumeric, '_' or '-'."""
+    if not slug or not _SLUG_RE.fullmatch(slug):
+        raise click.ClickException(
+            "Invalid slug format. Use lowercase alphanumeric, underscores, or hyphens."
+        )
+
+
+def build_manifest(
+    slug: str,
+    name: str,
+    description: Optional[str] = None,
+    minimal: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build a template manifest dictionary.
+
+    This is the logic behind ``mdb generate manifest``, kept free of Click
+    argument parsing and file I/O so it can be called directly.
+
+    Args:
+        slug: App slug (lowercase alphanumeric, underscores, hyphens)
+        name: Human-readable app name
+        description: Optional app description
+        minimal: Only include the basic fields (no auth, indexes, websockets)
+
+    Returns:
+        Manifest dictionary
+
+    Raises:
+        click.ClickException: If the slug format is invalid
+    """
+    _validate_slug(slug)
+
+    manifest: Dict[str, Any] = {
+        "schema_version": CURRENT_SCHEMA_VERSION,
+        "slug": slug,
+        "name": name,
+        "status": "draft",
+    }
+
+    if description:
+        manifest["description"] = description
+
+    if not minimal:
+        # Add common sections
+        manifest["auth"] = {
+            "policy": {
+                "provider": "casbin",
+                "required": False,
+                "allow_anonymous": True,
+                "authorization": {
+                    "model": "rbac",
+                    "link_users_roles": True,
+                },
+            },
+        }
+        manifest["managed_indexes"] = {}
+        manifest["websockets"] = {}
+
+    return manifest
+
+
 # --- CLI Commands ---
 
 
@@ -469,38 +539,12 @@ def generate_manifest(
         mdb generate manifest --slug my-app --name "My App" --minimal
     """
     try:
-        # Validate slug format
-        if not slug or not all(c.isalnum() or c in ("_", "-") for c in slug):
-            raise click.ClickException(
-                "Invalid slug format. Use lowercase alphanumeric, underscores, or hyphens."
-            )
-
-        # Generate template manifest
-        manifest: Dict[str, Any] = {
-            "schema_version": CURRENT_SCHEMA_VERSION,
-            "slug": slug,
-            "name": name,
-            "status": "draft",
-        }
-
-        if description:
-            manifest["description"] = description
-
-        if not minimal:
-            # Add common sections
-            manifest["auth"] = {
-                "policy": {
-                    "provider": "casbin",
-                    "required": False,
-                    "allow_anonymous": True,
-                    "authorization": {
-                        "model": "rbac",
-                        "link_users_roles": True,
-                    },
-                },
-            }
-            manifest["managed_indexes"] = {}
-            manifest["websockets"] = {}
+        manifest = build_manifest(
+            slug=slug,
+            name=name,
+            description=description,
+            minimal=minimal,
+        )
 
         # Save manifest
         save_manifest_file(output, manifest)
@@ -588,11 +632,7 @@ def generate_app(
             --read-scopes dashboard --read-scopes click_tracker
     """
     try:
-        # Validate slug format
-        if not slug or not all(c.isalnum() or c in ("_", "-") for c in slug):
-            raise click.ClickException(
-                "Invalid slug format. Use lowercase alphanumeric, underscores, or hyphens."
-            )
+        _validate_slug(slug)
 
         # Convert read_scopes tuple to list
         scopes_list = list(read_scopes) if read_scopes else None
@@ -12,7 +12,7 @@ from pathlib import Path
 import click
 
 from ...core.manifest import CURRENT_SCHEMA_VERSION, migrate_manifest
-from ..utils import load_manifest_file, save_manifest_file
+from ..utils import dump_manifest_json, load_manifest_file, save_manifest_file
 
 
 @click.command()
@@ -60,14 +60,21 @@ def migrate(
 
         # Determine output
         if in_place:
+            if migrated_manifest == manifest:
+                # Nothing changed - keep the file as-is instead of rewriting it
+                click.echo(
+                    click.style(
+                        f"✅ Manifest already at version {target_version}: {manifest_file}",
+                        fg="green",
+                    )
+                )
+                sys.exit(0)
             output_path = manifest_file
         elif output:
             output_path = output
         else:
             # Output to stdout
-            import json
-
-            click.echo(json.dumps(migrated_manifest, indent=2, ensure_ascii=False))
+            click.echo(dump_manifest_json(migrated_manifest))
             sys.exit(0)
 
         # Save to file
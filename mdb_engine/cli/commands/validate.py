@@ -12,7 +12,7 @@ from pathlib import Path
 import click
 
 from ...core.manifest import ManifestValidator
-from ..utils import load_manifest_file
+from ..utils import load_manifest_file, scan_missing_required_fields
 
 
 @click.command()
@@ -23,7 +23,12 @@ from ..utils import load_manifest_file
     is_flag=True,
     help="Show detailed validation errors",
 )
-def validate(manifest_file: Path, verbose: bool) -> None:
+@click.option(
+    "--quick",
+    is_flag=True,
+    help="Stream the file first and fail fast on missing required fields (needs ijson)",
+)
+def validate(manifest_file: Path, verbose: bool, quick: bool) -> None:
     """
     Validate a manifest.json file against the schema.
 
@@ -32,14 +37,24 @@ def validate(manifest_file: Path, verbose: bool) -> None:
     Examples:
         mdb validate manifest.json
         mdb validate path/to/manifest.json --verbose
+        mdb validate large_manifest.json --quick
     """
     try:
-        # Load manifest
-        manifest = load_manifest_file(manifest_file)
+        # --quick rejects manifests missing required fields without a full
+        # parse; anything else (or a file that can't be streamed) still gets
+        # the full load and schema validation below
+        missing = scan_missing_required_fields(manifest_file) if quick else None
+        if missing:
+            is_valid = False
+            error_message = "; ".join(f"'{field}' is a required property" for field in missing)
+            error_paths = ["root"]
+        else:
+            # Load manifest
+            manifest = load_manifest_file(manifest_file)
 
-        # Validate
-        validator = ManifestValidator()
-        is_valid, error_message, error_paths = validator.validate(manifest)
+            # Validate
+            validator = ManifestValidator()
+            is_valid, error_message, error_paths = validator.validate(manifest)
 
         if is_valid:
             click.echo(click.style(f"✅ Manifest '{manifest_file}' is valid!", fg="green"))
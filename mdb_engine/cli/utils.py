@@ -8,10 +8,23 @@ This module is part of MDB_ENGINE - MongoDB Engine.
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence
 
 import click
 
+from ..core.manifest import MANIFEST_SCHEMA
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
+# Top-level fields every manifest must define
+REQUIRED_MANIFEST_FIELDS = tuple(MANIFEST_SCHEMA["required"])
+
 
 def load_manifest_file(file_path: Path) -> Dict[str, Any]:
     """
@@ -36,6 +49,63 @@ def load_manifest_file(file_path: Path) -> Dict[str, Any]:
         raise click.ClickException(f"Invalid JSON in manifest file: {e}") from e
 
 
+def scan_missing_required_fields(
+    file_path: Path, required: Sequence[str] = REQUIRED_MANIFEST_FIELDS
+) -> Optional[List[str]]:
+    """
+    Stream a manifest's top-level keys and report missing required fields.
+
+    Uses ijson (optional) so the file is never materialized as a dict. The
+    scan stops as soon as every required field has been seen, so an empty
+    result says nothing about the rest of the file.
+
+    Args:
+        file_path: Path to manifest.json file
+        required: Top-level field names that must be present
+
+    Returns:
+        List of missing fields (empty if all present), or None if the file
+        could not be streamed (ijson not installed, invalid JSON, or the
+        top-level value is not an object). Unless fields are missing, callers
+        must still load and validate the whole manifest.
+    """
+    if not IJSON_AVAILABLE:
+        return None
+
+    remaining = set(required)
+    try:
+        with open(file_path, "rb") as f:
+            events = ijson.parse(f)
+            first = next(events, None)
+            if first is None or first[:2] != ("", "start_map"):
+                return None
+            for prefix, event, value in events:
+                if prefix == "" and event == "map_key":
+                    remaining.discard(value)
+                    if not remaining:
+                        return []
+    except (ijson.JSONError, OSError):
+        return None
+
+    return [field for field in required if field in remaining]
+
+
+def dump_manifest_json(manifest: Dict[str, Any]) -> str:
+    """
+    Serialize a manifest to its canonical JSON text.
+
+    Manifests stay plain dicts throughout the CLI pipeline and are
+    stringified exactly once, here, at output time.
+
+    Args:
+        manifest: Manifest dictionary
+
+    Returns:
+        Indented JSON string
+    """
+    return json.dumps(manifest, indent=2, ensure_ascii=False)
+
+
 def save_manifest_file(file_path: Path, manifest: Dict[str, Any]) -> None:
     """
     Save a manifest dictionary to a JSON file.
@@ -49,7 +119,7 @@ def save_manifest_file(file_path: Path, manifest: Dict[str, Any]) -> None:
     """
     try:
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+            f.write(dump_manifest_json(manifest))
     except OSError as e:
         raise click.ClickException(f"Failed to write manifest file: {e}") from e
 
@@ -66,7 +136,7 @@ def format_manifest_output(manifest: Dict[str, Any], format_type: str) -> str:
         Formatted string representation
     """
     if format_type == "json":
-        return json.dumps(manifest, indent=2, ensure_ascii=False)
+        return dump_manifest_json(manifest)
     elif format_type == "yaml":
         try:
             import yaml
@@ -77,7 +147,7 @@ def format_manifest_output(manifest: Dict[str, Any], format_type: str) -> str:
                 "Warning: PyYAML not installed. Falling back to JSON format.",
                 err=True,
             )
-            return json.dumps(manifest, indent=2, ensure_ascii=False)
+            return dump_manifest_json(manifest)
     elif format_type == "pretty":
         # Pretty print with key information
         lines = []
@@ -89,4 +159,4 @@ def format_manifest_output(manifest: Dict[str, Any], format_type: str) -> str:
             lines.append(f"Description: {manifest.get('description')}")
         return "\n".join(lines)
     else:
-        return json.dumps(manifest, indent=2, ensure_ascii=False)
+        return dump_manifest_json(manifest)
@@ -201,3 +201,43 @@ MAX_SESSIONS_PER_USER: int = int(os.getenv("MAX_SESSIONS_PER_USER", "10"))
 
 SESSION_INACTIVITY_TIMEOUT: int = int(os.getenv("SESSION_INACTIVITY_TIMEOUT", "1800"))  # 30 minutes
 """Session inactivity timeout in seconds (default: 1800 / 30 minutes)."""
+
+# ============================================================================
+# PASSWORD HASHING CONFIGURATION
+# ============================================================================
+
+BCRYPT_ROUNDS_ENV_VAR: str = "MDB_ENGINE_BCRYPT_ROUNDS"
+"""Environment variable overriding the bcrypt work factor (ignored in production)."""
+
+DEFAULT_BCRYPT_ROUNDS: int = 12
+"""Default bcrypt work factor (matches bcrypt.gensalt())."""
+
+MIN_BCRYPT_ROUNDS: int = 4
+"""Lowest work factor bcrypt accepts."""
+
+
+def get_bcrypt_rounds() -> int:
+    """
+    Get the bcrypt work factor for new password hashes.
+
+    MDB_ENGINE_BCRYPT_ROUNDS can lower (or raise) the cost, e.g. to keep test
+    suites fast. The override is ignored when running in production
+    (MDB_ENGINE_ENV / ENVIRONMENT / G_NOME_ENV set to "production"), so a
+    stray setting can never weaken real password hashes. Existing hashes are
+    unaffected: bcrypt stores the cost in each hash.
+
+    Returns:
+        Work factor between MIN_BCRYPT_ROUNDS and 31
+    """
+    is_production = any(
+        os.getenv(var, "").lower() == "production"
+        for var in ("MDB_ENGINE_ENV", "ENVIRONMENT", "G_NOME_ENV")
+    )
+    value = os.getenv(BCRYPT_ROUNDS_ENV_VAR)
+    if is_production or not value:
+        return DEFAULT_BCRYPT_ROUNDS
+    try:
+        rounds = int(value)
+    except ValueError:
+        return DEFAULT_BCRYPT_ROUNDS
+    return max(MIN_BCRYPT_ROUNDS, min(rounds, 31))
@@ -41,6 +41,7 @@ class ConnectionManager:
         db_name: str,
         max_pool_size: int = DEFAULT_MAX_POOL_SIZE,
         min_pool_size: int = DEFAULT_MIN_POOL_SIZE,
+        mongo_client: Optional[AsyncIOMotorClient] = None,
     ) -> None:
         """
         Initialize the connection manager.
@@ -50,12 +51,18 @@ class ConnectionManager:
             db_name: Database name
             max_pool_size: Maximum MongoDB connection pool size
             min_pool_size: Minimum MongoDB connection pool size
+            mongo_client: Existing client to use instead of creating one (optional).
+                The caller owns it: shutdown() does not close an injected client,
+                and mongo_uri/pool settings are not applied to it.
         """
         self.mongo_uri = mongo_uri
         self.db_name = db_name
         self.max_pool_size = max_pool_size
         self.min_pool_size = min_pool_size
 
+        # Externally owned client (shared across managers, e.g. in test suites)
+        self._injected_client: Optional[AsyncIOMotorClient] = mongo_client
+
         # Connection state
         self._mongo_client: Optional[AsyncIOMotorClient] = None
         self._mongo_db: Optional[AsyncIOMotorDatabase] = None
@@ -90,17 +97,20 @@ class ConnectionManager:
         )
 
         try:
-            # Connect to MongoDB
-            self._mongo_client = AsyncIOMotorClient(
-                self.mongo_uri,
-                serverSelectionTimeoutMS=DEFAULT_SERVER_SELECTION_TIMEOUT_MS,
-                appname="MDB_ENGINE",
-                maxPoolSize=self.max_pool_size,
-                minPoolSize=self.min_pool_size,
-                maxIdleTimeMS=DEFAULT_MAX_IDLE_TIME_MS,
-                retryWrites=True,
-                retryReads=True,
-            )
+            # Connect to MongoDB (or reuse the injected client)
+            if self._injected_client is not None:
+                self._mongo_client = self._injected_client
+            else:
+                self._mongo_client = AsyncIOMotorClient(
+                    self.mongo_uri,
+                    serverSelectionTimeoutMS=DEFAULT_SERVER_SELECTION_TIMEOUT_MS,
+                    appname="MDB_ENGINE",
+                    maxPoolSize=self.max_pool_size,
+                    minPoolSize=self.min_pool_size,
+                    maxIdleTimeMS=DEFAULT_MAX_IDLE_TIME_MS,
+                    retryWrites=True,
+                    retryReads=True,
+                )
 
             # Verify connection
             await self._mongo_client.admin.command("ping")
@@ -182,8 +192,8 @@ class ConnectionManager:
 
         contextual_logger.info("Shutting down MongoDB connection...")
 
-        # Close MongoDB connection
-        if self._mongo_client:
+        # Close MongoDB connection (an injected client belongs to the caller)
+        if self._mongo_client and self._mongo_client is not self._injected_client:
             self._mongo_client.close()
             contextual_logger.info("MongoDB connection closed.")
 
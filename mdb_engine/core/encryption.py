@@ -16,6 +16,7 @@ cannot be decrypted without the master key.
 """
 
 import base64
+import binascii
 import logging
 import os
 import secrets
@@ -33,6 +34,9 @@ MASTER_KEY_ENV_VAR = "MDB_ENGINE_MASTER_KEY"
 AES_KEY_SIZE = 32  # 256 bits
 AES_NONCE_SIZE = 12  # 96 bits for GCM
 
+# Length of a base64-encoded AES_KEY_SIZE key (44 characters for 32 bytes)
+_MASTER_KEY_B64_LENGTH = 4 * ((AES_KEY_SIZE + 2) // 3)
+
 
 class EnvelopeEncryptionService:
     """
@@ -63,6 +67,14 @@ class EnvelopeEncryptionService:
                 f"Master key not found. Set {MASTER_KEY_ENV_VAR} environment variable "
                 "or provide master_key parameter."
             )
+        # The master key is fixed for the service's lifetime; build its cipher once
+        self._master_aesgcm = AESGCM(self._master_key)
+
+    def _master_cipher(self, master_key: bytes | None) -> AESGCM:
+        """Return the AES-GCM cipher for ``master_key``, reusing the instance one."""
+        if not master_key or master_key is self._master_key:
+            return self._master_aesgcm
+        return AESGCM(master_key)
 
     def _load_master_key(self) -> bytes | None:
         """
@@ -79,8 +91,17 @@ class EnvelopeEncryptionService:
             return None
 
         try:
+            # A full-size key always encodes to this length; reject others before decoding
+            master_key_str = master_key_str.strip()
+            if len(master_key_str) != _MASTER_KEY_B64_LENGTH:
+                raise ValueError(
+                    f"Master key must be {AES_KEY_SIZE} bytes (256 bits) when decoded. "
+                    f"Got {len(master_key_str)} base64 characters, "
+                    f"expected {_MASTER_KEY_B64_LENGTH}."
+                )
+
             # Decode base64-encoded master key
-            master_key_bytes = base64.b64decode(master_key_str.encode())
+            master_key_bytes = binascii.a2b_base64(master_key_str)
             if len(master_key_bytes) != AES_KEY_SIZE:
                 raise ValueError(
                     f"Master key must be {AES_KEY_SIZE} bytes (256 bits) when decoded. "
@@ -142,22 +163,24 @@ class EnvelopeEncryptionService:
             >>> service = EnvelopeEncryptionService()
             >>> encrypted_secret, encrypted_dek = service.encrypt_secret("my_secret")
         """
-        master_key = master_key or self._master_key
-
         # Generate random DEK
         dek = self.generate_dek()
 
+        # Draw both nonces in one call; nothing is pooled across calls, so forked
+        # workers can never reuse a nonce
+        nonces = secrets.token_bytes(2 * AES_NONCE_SIZE)
+        nonce_secret = nonces[:AES_NONCE_SIZE]
+        nonce_dek = nonces[AES_NONCE_SIZE:]
+
         # Encrypt secret with DEK
         aesgcm_secret = AESGCM(dek)
-        nonce_secret = secrets.token_bytes(AES_NONCE_SIZE)
         encrypted_secret = aesgcm_secret.encrypt(nonce_secret, secret.encode(), None)
 
         # Prepend nonce to encrypted secret
         encrypted_secret_with_nonce = nonce_secret + encrypted_secret
 
         # Encrypt DEK with master key
-        aesgcm_dek = AESGCM(master_key)
-        nonce_dek = secrets.token_bytes(AES_NONCE_SIZE)
+        aesgcm_dek = self._master_cipher(master_key)
         encrypted_dek = aesgcm_dek.encrypt(nonce_dek, dek, None)
 
         # Prepend nonce to encrypted DEK
@@ -194,8 +217,6 @@ class EnvelopeEncryptionService:
             >>> service = EnvelopeEncryptionService()
             >>> secret = service.decrypt_secret(encrypted_secret, encrypted_dek)
         """
-        master_key = master_key or self._master_key
-
         try:
             # Extract nonce and encrypted data for DEK
             if len(encrypted_dek) < AES_NONCE_SIZE:
@@ -204,14 +225,16 @@ class EnvelopeEncryptionService:
             encrypted_dek_data = encrypted_dek[AES_NONCE_SIZE:]
 
             # Decrypt DEK with master key
-            aesgcm_dek = AESGCM(master_key)
+            aesgcm_dek = self._master_cipher(master_key)
             dek = aesgcm_dek.decrypt(nonce_dek, encrypted_dek_data, None)
 
             # Extract nonce and encrypted data for secret
             if len(encrypted_secret) < AES_NONCE_SIZE:
                 raise ValueError("Encrypted secret too short (missing nonce)")
-            nonce_secret = encrypted_secret[:AES_NONCE_SIZE]
-            encrypted_secret_data = encrypted_secret[AES_NONCE_SIZE:]
+            # Slice through a memoryview so large ciphertexts are not copied
+            encrypted_secret_view = memoryview(encrypted_secret)
+            nonce_secret = encrypted_secret_view[:AES_NONCE_SIZE]
+            encrypted_secret_data = encrypted_secret_view[AES_NONCE_SIZE:]
 
             # Decrypt secret with DEK
             aesgcm_secret = AESGCM(dek)
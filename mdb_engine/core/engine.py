@@ -101,6 +101,7 @@ class MongoDBEngine:
         # Optional Ray support
         enable_ray: bool = False,
         ray_namespace: str = "modular_labs",
+        mongo_client: Optional[AsyncIOMotorClient] = None,
     ) -> None:
         """
         Initialize the MongoDB Engine.
@@ -116,6 +117,8 @@ class MongoDBEngine:
                 Default: False. Only activates if Ray is installed.
             ray_namespace: Ray namespace for actor isolation.
                 Default: "modular_labs"
+            mongo_client: Existing AsyncIOMotorClient to use instead of creating
+                one (optional). It is not closed on shutdown(); the caller owns it.
         """
         self.mongo_uri = mongo_uri
         self.db_name = db_name
@@ -135,6 +138,7 @@ class MongoDBEngine:
             db_name=db_name,
             max_pool_size=max_pool_size,
             min_pool_size=min_pool_size,
+            mongo_client=mongo_client,
         )
 
         # Validators
@@ -164,11 +168,18 @@ class MongoDBEngine:
         3. Sets up initial state
         4. Initializes Ray if enabled and available
 
+        Calling it again on an initialized engine is a no-op, so registered
+        apps and managers are kept. Call shutdown() first to re-initialize.
+
         Raises:
             InitializationError: If initialization fails (subclass of RuntimeError
                 for backward compatibility)
             RuntimeError: If initialization fails (for backward compatibility)
         """
+        if self._initialized:
+            logger.debug("MongoDBEngine already initialized. Skipping re-initialization.")
+            return
+
         # Initialize connection
         await self._connection_manager.initialize()
 
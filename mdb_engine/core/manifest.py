@@ -34,7 +34,9 @@ import hashlib
 import logging
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from jsonschema import SchemaError, ValidationError, validate
+from jsonschema import SchemaError, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from ..constants import (
     CURRENT_SCHEMA_VERSION,
@@ -54,6 +56,27 @@ SCHEMA_REGISTRY: Dict[str, Dict[str, Any]] = {}
 _validation_cache: Dict[str, Tuple[bool, Optional[str], Optional[List[str]]]] = {}
 _cache_lock = asyncio.Lock()
 
+# Compiled validators: maps id(schema) -> (schema, validator), so each schema is
+# checked against its meta-schema once rather than on every validation
+_schema_validators: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+
+
+def _get_schema_validator(schema: Dict[str, Any]) -> Any:
+    """
+    Get the compiled validator for a schema, building it on first use.
+
+    Raises:
+        SchemaError: If the schema itself is invalid
+    """
+    entry = _schema_validators.get(id(schema))
+    # The identity check guards against a replaced registry schema reusing an id
+    if entry is None or entry[0] is not schema:
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        entry = (schema, validator_cls(schema))
+        _schema_validators[id(schema)] = entry
+    return entry[1]
+
 
 def _convert_tuples_to_lists(obj: Any) -> Any:
     """
@@ -2220,7 +2243,9 @@ async def _validate_manifest_async(
         # Note: Tuple-to-list conversion should happen at the API boundary (register_app),
         # not here. This keeps validation logic clean and schema-agnostic.
         # Validate against appropriate schema
-        validate(instance=manifest_data, schema=schema)
+        error = best_match(_get_schema_validator(schema).iter_errors(manifest_data))
+        if error is not None:
+            raise error
 
         # Cache success result
         result = (True, None, None)
@@ -40,10 +40,12 @@ setup(
     extras_require={
         "casbin": ["casbin>=1.0.0", "casbin-motor-adapter>=0.1.0"],
         "oso": ["oso-cloud>=0.1.0"],
+        "cli": ["ijson>=3.2.0"],
         "all": [
             "casbin>=1.0.0",
             "casbin-motor-adapter>=0.1.0",
             "oso-cloud>=0.1.0",
+            "ijson>=3.2.0",
         ],
     },
     classifiers=[
@@ -0,0 +1,37 @@
+"""
+Shared fixtures for CLI tests.
+
+Resolves the Click command callbacks once at import so tests that only
+check generated output can call them directly, bypassing Click's argv
+parsing pipeline. Tests that assert on CLI UX keep using ``CliRunner``.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from mdb_engine.cli.main import cli
+
+# Resolved once per session: cli -> generate group -> subcommand callback
+GEN_MANIFEST = cli.commands["generate"].commands["manifest"].callback
+GEN_APP = cli.commands["generate"].commands["app"].callback
+
+
+@pytest.fixture(scope="session")
+def gen_manifest():
+    """Callback behind ``mdb generate manifest``."""
+    return GEN_MANIFEST
+
+
+@pytest.fixture(scope="session")
+def gen_app():
+    """Callback behind ``mdb generate app``."""
+    return GEN_APP
+
+
+@pytest.fixture
+def fake_dir(fs):
+    """Empty directory on pyfakefs' in-memory filesystem (no disk I/O)."""
+    path = Path("/fake")
+    fs.create_dir(path)
+    return path
@@ -5,58 +5,46 @@ Tests the manifest validation CLI command.
 """
 
 import json
-import tempfile
-from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
+from mdb_engine.cli import utils as cli_utils
 from mdb_engine.cli.main import cli
+from mdb_engine.cli.utils import scan_missing_required_fields
+from mdb_engine.core.manifest import ManifestValidator
 
 
 class TestValidateCommand:
     """Test the validate command."""
 
-    def test_validate_valid_manifest(self):
+    def test_validate_valid_manifest(self, tmp_path):
         """Test validating a valid manifest."""
         runner = CliRunner()
 
-        # Create a temporary valid manifest
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            manifest = {
-                "schema_version": "2.0",
-                "slug": "test_app",
-                "name": "Test App",
-                "status": "active",
-            }
-            json.dump(manifest, f)
-            manifest_path = Path(f.name)
-
-        try:
-            result = runner.invoke(cli, ["validate", str(manifest_path)])
-            assert result.exit_code == 0
-            assert "valid" in result.output.lower()
-        finally:
-            manifest_path.unlink()
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(
+            json.dumps(
+                {
+                    "schema_version": "2.0",
+                    "slug": "test_app",
+                    "name": "Test App",
+                    "status": "active",
+                }
+            )
+        )
+
+        result = runner.invoke(cli, ["validate", str(manifest_path)])
+        assert result.exit_code == 0
+        assert "valid" in result.output.lower()
 
     def test_validate_invalid_manifest(self):
         """Test validating an invalid manifest."""
-        runner = CliRunner()
+        # Missing required fields (slug and name), passed as a dict
+        is_valid, error_message, _ = ManifestValidator().validate({"schema_version": "2.0"})
 
-        # Create a temporary invalid manifest (missing required fields)
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            manifest = {
-                "schema_version": "2.0",
-                # Missing slug and name
-            }
-            json.dump(manifest, f)
-            manifest_path = Path(f.name)
-
-        try:
-            result = runner.invoke(cli, ["validate", str(manifest_path)])
-            assert result.exit_code == 1
-            assert "invalid" in result.output.lower()
-        finally:
-            manifest_path.unlink()
+        assert is_valid is False
+        assert "slug" in error_message
 
     def test_validate_nonexistent_file(self):
         """Test validating a non-existent file."""
@@ -64,19 +52,106 @@ class TestValidateCommand:
         result = runner.invoke(cli, ["validate", "nonexistent.json"])
         assert result.exit_code != 0
 
-    def test_validate_with_verbose(self):
+    def test_validate_with_verbose(self, tmp_path):
         """Test validating with verbose output."""
         runner = CliRunner()
 
-        # Create a temporary invalid manifest
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            manifest = {"schema_version": "2.0"}  # Missing required fields
-            json.dump(manifest, f)
-            manifest_path = Path(f.name)
-
-        try:
-            result = runner.invoke(cli, ["validate", str(manifest_path), "--verbose"])
-            assert result.exit_code == 1
-            assert "invalid" in result.output.lower()
-        finally:
-            manifest_path.unlink()
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"schema_version": "2.0"}))  # Missing required fields
+
+        result = runner.invoke(cli, ["validate", str(manifest_path), "--verbose"])
+        assert result.exit_code == 1
+        assert "invalid" in result.output.lower()
+
+    def test_validate_quick_reports_missing_fields(self, tmp_path):
+        """Test that --quick reports missing required fields."""
+        pytest.importorskip("ijson")
+        runner = CliRunner()
+
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"schema_version": "2.0", "slug": "test_app"}))
+
+        result = runner.invoke(cli, ["validate", str(manifest_path), "--quick"])
+        assert result.exit_code == 1
+        assert "'name' is a required property" in result.output
+
+    def test_validate_quick_skips_load_when_fields_missing(self, tmp_path, monkeypatch):
+        """Test that --quick fails fast without materializing the manifest."""
+        pytest.importorskip("ijson")
+        from mdb_engine.cli.commands import validate as validate_module
+
+        def fail_load(_path):
+            raise AssertionError("manifest should not be loaded")
+
+        monkeypatch.setattr(validate_module, "load_manifest_file", fail_load)
+        runner = CliRunner()
+
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"schema_version": "2.0"}))
+
+        result = runner.invoke(cli, ["validate", str(manifest_path), "--quick"])
+        assert result.exit_code == 1
+        assert "'slug' is a required property" in result.output
+
+    def test_validate_quick_rejects_truncated_manifest(self, tmp_path):
+        """Test that --quick fully parses a file once the required fields are present."""
+        pytest.importorskip("ijson")
+        runner = CliRunner()
+
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text('{"slug": "test_app", "name": "Test App", "status": ')
+
+        result = runner.invoke(cli, ["validate", str(manifest_path), "--quick"])
+        assert result.exit_code != 0
+        assert "Invalid JSON" in result.output
+        assert "is valid" not in result.output
+
+    def test_validate_quick_checks_schema(self, tmp_path):
+        """Test that --quick still applies the full schema when required fields exist."""
+        pytest.importorskip("ijson")
+        runner = CliRunner()
+
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(
+            json.dumps({"slug": "test_app", "name": "Test App", "status": "bogus"})
+        )
+
+        result = runner.invoke(cli, ["validate", str(manifest_path), "--quick"])
+        assert result.exit_code == 1
+        assert "invalid" in result.output.lower()
+
+
+class TestScanMissingRequiredFields:
+    """Test the streaming required-field check behind validate --quick."""
+
+    def test_reports_missing_fields(self, tmp_path):
+        """Missing top-level fields are reported in schema order."""
+        pytest.importorskip("ijson")
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"schema_version": "2.0"}))
+
+        assert scan_missing_required_fields(manifest_path) == ["slug", "name"]
+
+    def test_all_fields_present(self, tmp_path):
+        """Nested keys named like required fields do not count."""
+        pytest.importorskip("ijson")
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"data": {"slug": "x"}, "slug": "a", "name": "A"}))
+
+        assert scan_missing_required_fields(manifest_path) == []
+
+    def test_falls_back_without_ijson(self, tmp_path, monkeypatch):
+        """Without ijson the caller is told to fall back to a full load."""
+        monkeypatch.setattr(cli_utils, "IJSON_AVAILABLE", False)
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"schema_version": "2.0"}))
+
+        assert scan_missing_required_fields(manifest_path) is None
+
+    def test_invalid_json_falls_back(self, tmp_path):
+        """Invalid JSON is left to the full loader to report."""
+        pytest.importorskip("ijson")
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text("{not json")
+
+        assert scan_missing_required_fields(manifest_path) is None
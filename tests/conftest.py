@@ -9,6 +9,8 @@ This module provides:
 """
 
 import asyncio
+import base64
+import copy
 import os
 from typing import Any, AsyncGenerator, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -24,6 +26,7 @@ from motor.motor_asyncio import (
 if "FLASK_SECRET_KEY" not in os.environ:
     os.environ["FLASK_SECRET_KEY"] = "test_secret_key_for_testing_only_" + "x" * 32
 
+from mdb_engine.config import BCRYPT_ROUNDS_ENV_VAR, MIN_BCRYPT_ROUNDS
 from mdb_engine.core.encryption import EnvelopeEncryptionService
 
 # Import engine components for testing
@@ -491,6 +494,17 @@ def reset_environment(monkeypatch):
     # Cleanup happens automatically
 
 
+@pytest.fixture(autouse=True)
+def fast_bcrypt(request, monkeypatch):
+    """
+    Hash passwords at bcrypt's minimum work factor.
+
+    Tests marked ``bcrypt_full_rounds`` keep the production cost.
+    """
+    if request.node.get_closest_marker("bcrypt_full_rounds") is None:
+        monkeypatch.setenv(BCRYPT_ROUNDS_ENV_VAR, str(MIN_BCRYPT_ROUNDS))
+
+
 # ============================================================================
 # TESTCONTAINERS FIXTURES (Real MongoDB for Integration Tests)
 # ============================================================================
@@ -559,13 +573,14 @@ async def real_mongo_db(real_mongo_client):
     """
     Create a real MongoDB database for testing.
 
-    Uses a unique database name per test run to avoid conflicts.
-    Automatically drops the database after the test.
+    Uses a unique database name per test run (and per pytest-xdist worker)
+    to avoid conflicts. Automatically drops the database after the test.
     """
     import os
 
-    # Unique database name per test process
-    db_name = f"test_db_{os.getpid()}_{id(real_mongo_client)}"
+    # Unique database name per xdist worker and test process
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    db_name = f"test_db_{worker_id}_{os.getpid()}_{id(real_mongo_client)}"
     db = real_mongo_client[db_name]
 
     yield db
@@ -605,19 +620,26 @@ async def real_mongodb_engine(mongodb_container, real_mongo_db):
 @pytest.fixture
 async def clean_test_db(real_mongo_db):
     """
-    Clean test database fixture that drops all collections between tests.
+    Clean test database fixture that undoes what the test wrote.
 
-    This ensures test isolation by cleaning up data after each test.
+    Collections created by the test are dropped. Collections that existed
+    before the test keep their indexes but are emptied, so documents the
+    test inserted into them do not leak into later tests.
     """
-    # Get all collection names
-    collection_names = await real_mongo_db.list_collection_names()
+    # Snapshot collections that already exist
+    existing = set(await real_mongo_db.list_collection_names())
 
     yield real_mongo_db
 
-    # Cleanup: drop all collections
-    for collection_name in collection_names:
+    # Cleanup: drop new collections, empty pre-existing ones
+    for collection_name in await real_mongo_db.list_collection_names():
+        if collection_name.startswith("system."):
+            continue
         try:
-            await real_mongo_db.drop_collection(collection_name)
+            if collection_name in existing:
+                await real_mongo_db[collection_name].delete_many({})
+            else:
+                await real_mongo_db.drop_collection(collection_name)
         except (ConnectionError, RuntimeError, OSError):
             pass  # Ignore cleanup errors
 
@@ -627,17 +649,20 @@ async def clean_test_db(real_mongo_db):
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def master_key():
-    """Generate a test master key for encryption tests."""
+    """
+    Generate a test master key for encryption tests.
+
+    Session-scoped: the key and the service built from it are immutable,
+    so they are created once rather than for every test.
+    """
     return EnvelopeEncryptionService.generate_master_key()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def encryption_service(master_key):
     """Create encryption service with test master key."""
-    import base64
-
     key_bytes = base64.b64decode(master_key.encode())
     return EnvelopeEncryptionService(key_bytes)
 
@@ -650,33 +675,39 @@ def app_secrets_manager(mock_mongo_database, encryption_service):
     return AppSecretsManager(mock_mongo_database, encryption_service)
 
 
+# Example-app manifests. Tests get deep copies via the fixtures below.
+CLICK_TRACKER_MANIFEST: Dict[str, Any] = {
+    "schema_version": "2.0",
+    "slug": "click_tracker",
+    "name": "Click Tracker",
+    "description": "Tracks user clicks",
+    "status": "active",
+    "data_access": {
+        "read_scopes": ["click_tracker"],
+        "write_scope": "click_tracker",
+    },
+}
+
+DASHBOARD_MANIFEST: Dict[str, Any] = {
+    "schema_version": "2.0",
+    "slug": "click_tracker_dashboard",
+    "name": "Click Tracker Dashboard",
+    "description": "Admin dashboard",
+    "status": "active",
+    "data_access": {
+        "read_scopes": ["click_tracker_dashboard", "click_tracker"],
+        "write_scope": "click_tracker_dashboard",
+    },
+}
+
+
 @pytest.fixture
 def click_tracker_manifest():
     """ClickTracker manifest fixture."""
-    return {
-        "schema_version": "2.0",
-        "slug": "click_tracker",
-        "name": "Click Tracker",
-        "description": "Tracks user clicks",
-        "status": "active",
-        "data_access": {
-            "read_scopes": ["click_tracker"],
-            "write_scope": "click_tracker",
-        },
-    }
+    return copy.deepcopy(CLICK_TRACKER_MANIFEST)
 
 
 @pytest.fixture
 def dashboard_manifest():
     """ClickTrackerDashboard manifest fixture."""
-    return {
-        "schema_version": "2.0",
-        "slug": "click_tracker_dashboard",
-        "name": "Click Tracker Dashboard",
-        "description": "Admin dashboard",
-        "status": "active",
-        "data_access": {
-            "read_scopes": ["click_tracker_dashboard", "click_tracker"],
-            "write_scope": "click_tracker_dashboard",
-        },
-    }
+    return copy.deepcopy(DASHBOARD_MANIFEST)
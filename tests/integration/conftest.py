@@ -0,0 +1,151 @@
+"""
+Shared fixtures for integration tests.
+
+Integration tests need *a* valid master key, not a cryptographically unique
+one, so a fixed test-only key is used instead of generating one per test.
+Set MDB_TEST_MASTER_KEY to run the suite against a different key.
+
+Engines come in two flavours, mirroring a read-only / writable split:
+- ``registered_engine``: session-scoped, ClickTracker and its dashboard
+  registered once. For tests that do not change registration or secrets.
+- ``fresh_engine``: function-scoped, nothing registered. For tests that
+  rotate secrets or register extra apps.
+Both share the session-scoped ``motor_client``.
+Both run on the session event loop, so test classes using them must be
+marked ``@pytest.mark.asyncio(loop_scope="session")``.
+"""
+
+import asyncio
+import base64
+import copy
+import os
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+
+from mdb_engine.core.encryption import AES_KEY_SIZE, MASTER_KEY_ENV_VAR
+from mdb_engine.core.engine import MongoDBEngine
+
+from ..conftest import CLICK_TRACKER_MANIFEST, DASHBOARD_MANIFEST
+
+# Fixed, test-only master key (never use outside tests)
+_TEST_KEY = base64.b64encode(b"\x00" * AES_KEY_SIZE).decode()
+
+
+@pytest.fixture(scope="session")
+def master_key():
+    """Deterministic master key shared by the integration suite."""
+    return os.environ.get("MDB_TEST_MASTER_KEY", _TEST_KEY)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def motor_client(mongodb_container):
+    """
+    One AsyncIOMotorClient for every engine on the session event loop.
+
+    Engines get it injected, so each new engine skips server discovery and
+    connection-pool warm-up. Engines never close it; this fixture does.
+    """
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    client = AsyncIOMotorClient(_mongo_uri(mongodb_container), maxPoolSize=50)
+    yield client
+    client.close()
+
+
+def _mongo_uri(mongodb_container) -> str:
+    exposed_port = mongodb_container.get_exposed_port(27017)
+    return f"mongodb://localhost:{exposed_port}/?directConnection=true"
+
+
+async def _start_engine(
+    mongodb_container, motor_client, master_key: str, db_name: str
+) -> MongoDBEngine:
+    """Create and initialize an engine on the shared client with encryption enabled."""
+    # The master key is only read while the encryption service is created
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(MASTER_KEY_ENV_VAR, master_key)
+        engine = MongoDBEngine(
+            mongo_uri=_mongo_uri(mongodb_container),
+            db_name=db_name,
+            mongo_client=motor_client,
+        )
+        await engine.initialize()
+    return engine
+
+
+async def _stop_engine(engine: MongoDBEngine, db_name: str) -> None:
+    """Drop the engine's test database and shut it down."""
+    try:
+        await engine.mongo_client.drop_database(db_name)
+    except (ConnectionError, RuntimeError, OSError):
+        pass  # Ignore cleanup errors
+    await engine.shutdown()
+
+
+def _db_name(prefix: str) -> str:
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return f"{prefix}_{worker_id}_{os.getpid()}"
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def registered_engine(mongodb_container, motor_client, master_key):
+    """Engine with ClickTracker and its dashboard registered once per session."""
+    db_name = _db_name("test_registered")
+    engine = await _start_engine(mongodb_container, motor_client, master_key, db_name)
+
+    results = await asyncio.gather(
+        engine.register_app(copy.deepcopy(CLICK_TRACKER_MANIFEST)),
+        engine.register_app(copy.deepcopy(DASHBOARD_MANIFEST)),
+    )
+    assert results == [True, True]
+
+    yield engine
+
+    await _stop_engine(engine, db_name)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app_secrets(registered_engine):
+    """Secrets of the apps registered on ``registered_engine``, keyed by slug."""
+    manager = registered_engine._app_secrets_manager
+    slugs = [CLICK_TRACKER_MANIFEST["slug"], DASHBOARD_MANIFEST["slug"]]
+    secrets = await asyncio.gather(*(manager.get_app_secret(slug) for slug in slugs))
+    return dict(zip(slugs, secrets))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def seeded_clicks(registered_engine, app_secrets):
+    """
+    ClickTracker clicks inserted once per session on ``registered_engine``.
+
+    Returns the inserted ids. Tests must treat the seeded data as read-only.
+    """
+    tracker_db = registered_engine.get_scoped_db(
+        "click_tracker", app_token=app_secrets["click_tracker"]
+    )
+    now = datetime.now(timezone.utc)
+    click_docs = [
+        {
+            "user_id": f"user{i}@example.com",
+            "timestamp": now,
+            "url": f"/page{i}",
+            "element": "button",
+        }
+        for i in range(10)
+    ]
+    # Unordered: the server may apply the independent inserts in parallel
+    result = await tracker_db.clicks.insert_many(click_docs, ordered=False)
+    return result.inserted_ids
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def fresh_engine(mongodb_container, motor_client, master_key):
+    """Initialized engine on its own database, for tests that mutate state."""
+    db_name = _db_name(f"test_fresh_{os.urandom(4).hex()}")
+    engine = await _start_engine(mongodb_container, motor_client, master_key, db_name)
+
+    yield engine
+
+    await _stop_engine(engine, db_name)
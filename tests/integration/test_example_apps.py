@@ -4,87 +4,68 @@ Integration tests for example apps (ClickTracker and ClickTrackerDashboard).
 Tests end-to-end workflows with real apps.
 """
 
-import os
-from datetime import datetime
+import asyncio
+import copy
+from datetime import datetime, timezone
 
 import pytest
+import pytest_asyncio
 
-from mdb_engine.core.encryption import MASTER_KEY_ENV_VAR, EnvelopeEncryptionService
-
-
-@pytest.fixture
-def master_key():
-    """Generate a test master key."""
-    return EnvelopeEncryptionService.generate_master_key()
-
-
-@pytest.fixture
-def mongodb_engine_with_secrets(master_key, real_mongodb_engine):
-    """Create MongoDBEngine with encryption enabled."""
-    engine = real_mongodb_engine
-    os.environ[MASTER_KEY_ENV_VAR] = master_key
-    return engine
-
-
-@pytest.fixture
-def click_tracker_manifest():
-    """ClickTracker manifest fixture."""
-    return {
-        "schema_version": "2.0",
-        "slug": "click_tracker",
-        "name": "Click Tracker",
-        "description": "Tracks user clicks",
-        "status": "active",
-        "data_access": {
-            "read_scopes": ["click_tracker"],
-            "write_scope": "click_tracker",
-        },
-    }
-
-
-@pytest.fixture
-def dashboard_manifest():
-    """ClickTrackerDashboard manifest fixture."""
-    return {
-        "schema_version": "2.0",
-        "slug": "click_tracker_dashboard",
-        "name": "Click Tracker Dashboard",
-        "description": "Admin dashboard",
-        "status": "active",
-        "data_access": {
-            "read_scopes": ["click_tracker_dashboard", "click_tracker"],
-            "write_scope": "click_tracker_dashboard",
-        },
-    }
-
-
-@pytest.mark.asyncio
+from ..conftest import CLICK_TRACKER_MANIFEST, DASHBOARD_MANIFEST
+from .conftest import _db_name, _start_engine, _stop_engine
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def initialized_engine(mongodb_container, motor_client, master_key):
+    """
+    MongoDBEngine with encryption enabled and both example apps registered.
+
+    Class-scoped: initialization and app registration run once for the whole
+    test class. ``clean_clicks`` runs after every test to keep them isolated.
+    Uses the session ``motor_client``, so it runs on the session event loop.
+    """
+    db_name = _db_name("test_example_apps")
+    engine = await _start_engine(mongodb_container, motor_client, master_key, db_name)
+
+    # Independent registrations - overlap their MongoDB round-trips
+    results = await asyncio.gather(
+        engine.register_app(copy.deepcopy(CLICK_TRACKER_MANIFEST)),
+        engine.register_app(copy.deepcopy(DASHBOARD_MANIFEST)),
+    )
+    assert results == [True, True]
+
+    yield engine
+
+    await _stop_engine(engine, db_name)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def clean_clicks(initialized_engine):
+    """Remove ClickTracker clicks after each test so later tests start empty."""
+    yield
+    secret = await initialized_engine._app_secrets_manager.get_app_secret("click_tracker")
+    db = initialized_engine.get_scoped_db("click_tracker", app_token=secret)
+    await db.clicks.delete_many({})
+
+
+@pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.integration
+@pytest.mark.xdist_group("mongo")
+@pytest.mark.usefixtures("clean_clicks")
 class TestExampleApps:
     """Test example apps end-to-end."""
 
-    async def test_click_tracker_app_startup(
-        self, mongodb_engine_with_secrets, click_tracker_manifest, master_key
-    ):
+    async def test_click_tracker_app_startup(self, initialized_engine):
         """Test that ClickTracker app can start successfully."""
-        engine = mongodb_engine_with_secrets
-        await engine.initialize()
-
-        result = await engine.register_app(click_tracker_manifest)
-        assert result is True
+        engine = initialized_engine
 
         # Verify app is registered (check read_scopes mapping)
         assert "click_tracker" in engine._app_read_scopes
         assert "click_tracker" in engine._app_read_scopes["click_tracker"]
 
-    async def test_click_tracker_track_endpoint_flow(
-        self, mongodb_engine_with_secrets, click_tracker_manifest, master_key
-    ):
+    async def test_click_tracker_track_endpoint_flow(self, initialized_engine):
         """Test ClickTracker track endpoint flow."""
-        engine = mongodb_engine_with_secrets
-        await engine.initialize()
-
-        await engine.register_app(click_tracker_manifest)
+        engine = initialized_engine
 
         # Get secret
         secret = await engine._app_secrets_manager.get_app_secret("click_tracker")
@@ -94,7 +75,7 @@ class TestExampleApps:
 
         click_doc = {
             "user_id": "user@example.com",
-            "timestamp": datetime.utcnow(),
+            "timestamp": datetime.now(timezone.utc),
             "url": "/page",
             "element": "button",
             "session_id": "session123",
@@ -108,96 +89,78 @@ class TestExampleApps:
         assert inserted is not None
         assert inserted["user_id"] == "user@example.com"
 
-    async def test_dashboard_analytics_endpoint_flow(
-        self,
-        mongodb_engine_with_secrets,
-        click_tracker_manifest,
-        dashboard_manifest,
-        master_key,
-    ):
+    async def test_dashboard_analytics_endpoint_flow(self, initialized_engine):
         """Test Dashboard analytics endpoint flow."""
-        engine = mongodb_engine_with_secrets
-        await engine.initialize()
-
-        # Register both apps
-        await engine.register_app(click_tracker_manifest)
-        await engine.register_app(dashboard_manifest)
+        engine = initialized_engine
 
         # Get secrets
-        tracker_secret = await engine._app_secrets_manager.get_app_secret("click_tracker")
-        dashboard_secret = await engine._app_secrets_manager.get_app_secret(
-            "click_tracker_dashboard"
+        tracker_secret, dashboard_secret = await asyncio.gather(
+            engine._app_secrets_manager.get_app_secret("click_tracker"),
+            engine._app_secrets_manager.get_app_secret("click_tracker_dashboard"),
         )
 
         # Insert clicks via ClickTracker
         tracker_db = engine.get_scoped_db("click_tracker", app_token=tracker_secret)
-        for i in range(5):
-            await tracker_db.clicks.insert_one(
+        now = datetime.now(timezone.utc)
+        await tracker_db.clicks.insert_many(
+            [
                 {
                     "user_id": f"user{i}@example.com",
-                    "timestamp": datetime.utcnow(),
+                    "timestamp": now,
                     "url": f"/page{i}",
                     "element": "button",
                 }
-            )
+                for i in range(5)
+            ]
+        )
 
         # Read analytics via Dashboard (cross-app access)
         dashboard_db = engine.get_scoped_db("click_tracker_dashboard", app_token=dashboard_secret)
 
-        # Access ClickTracker's collection
+        # Access ClickTracker's collection (only app_id is asserted on)
         clicks = (
-            await dashboard_db.get_collection("click_tracker_clicks").find({}).to_list(length=100)
+            await dashboard_db.get_collection("click_tracker_clicks")
+            .find({}, {"app_id": 1})
+            .to_list(length=None)
         )
 
         assert len(clicks) == 5
         assert all(c["app_id"] == "click_tracker" for c in clicks)
 
-    async def test_end_to_end_workflow(
-        self,
-        mongodb_engine_with_secrets,
-        click_tracker_manifest,
-        dashboard_manifest,
-        master_key,
-    ):
+    async def test_end_to_end_workflow(self, initialized_engine):
         """Test full workflow: track clicks, view dashboard."""
-        engine = mongodb_engine_with_secrets
-        await engine.initialize()
-
-        # Register apps
-        await engine.register_app(click_tracker_manifest)
-        await engine.register_app(dashboard_manifest)
+        engine = initialized_engine
 
         # Get secrets
-        tracker_secret = await engine._app_secrets_manager.get_app_secret("click_tracker")
-        dashboard_secret = await engine._app_secrets_manager.get_app_secret(
-            "click_tracker_dashboard"
+        tracker_secret, dashboard_secret = await asyncio.gather(
+            engine._app_secrets_manager.get_app_secret("click_tracker"),
+            engine._app_secrets_manager.get_app_secret("click_tracker_dashboard"),
         )
 
         # Step 1: Track clicks
         tracker_db = engine.get_scoped_db("click_tracker", app_token=tracker_secret)
-        click_ids = []
-        for i in range(10):
-            result = await tracker_db.clicks.insert_one(
+        now = datetime.now(timezone.utc)
+        result = await tracker_db.clicks.insert_many(
+            [
                 {
                     "user_id": "user@example.com",
-                    "timestamp": datetime.utcnow(),
+                    "timestamp": now,
                     "url": f"/page{i}",
                     "element": "button",
                 }
-            )
-            click_ids.append(result.inserted_id)
+                for i in range(10)
+            ]
+        )
+        click_ids = result.inserted_ids
+        assert len(click_ids) == 10
 
         # Step 2: View analytics via dashboard
         dashboard_db = engine.get_scoped_db("click_tracker_dashboard", app_token=dashboard_secret)
 
-        # Get all clicks
-        all_clicks = (
-            await dashboard_db.get_collection("click_tracker_clicks").find({}).to_list(length=100)
-        )
-
-        assert len(all_clicks) == 10
+        # Count all clicks
+        clicks_collection = dashboard_db.get_collection("click_tracker_clicks")
+        assert await clicks_collection.count_documents({}) == 10
 
         # Step 3: Verify data isolation
         # Dashboard's own collections should be separate
-        dashboard_data = await dashboard_db.dashboard_data.find({}).to_list(length=100)
-        assert len(dashboard_data) == 0  # No dashboard data yet
+        assert await dashboard_db.dashboard_data.count_documents({}) == 0  # No dashboard data yet
@@ -0,0 +1,46 @@
+"""
+Shared fixtures for performance tests.
+"""
+
+import base64
+
+import pytest
+
+from mdb_engine.core.encryption import EnvelopeEncryptionService
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``throughput``-marked tests unless the run selects them with ``-m throughput``."""
+    if "throughput" in (config.getoption("markexpr") or ""):
+        return
+    skip = pytest.mark.skip(reason="opt-in benchmark; select with -m throughput")
+    for item in items:
+        if item.get_closest_marker("throughput"):
+            item.add_marker(skip)
+
+
+# Generated once per test process (i.e. per session / xdist worker)
+_KEY_BYTES = base64.b64decode(EnvelopeEncryptionService.generate_master_key().encode())
+
+
+@pytest.fixture(scope="session")
+def master_key_bytes():
+    """Raw master key bytes, e.g. for recreating the service in worker processes."""
+    return _KEY_BYTES
+
+
+@pytest.fixture(scope="session")
+def encryption_service(master_key_bytes):
+    """
+    Create encryption service with test master key.
+
+    Session-scoped: no test mutates the service, so construction happens
+    once instead of inside every timed test.
+    """
+    return EnvelopeEncryptionService(master_key_bytes)
+
+
+@pytest.fixture(scope="session")
+def encrypted_corpus(encryption_service):
+    """100 ``(encrypted_secret, encrypted_dek)`` pairs for ``secret_0``..``secret_99``."""
+    return [encryption_service.encrypt_secret(f"secret_{i}") for i in range(100)]
@@ -2,100 +2,145 @@
 Performance tests for encryption operations.
 
 Ensures encryption/decryption operations meet performance targets.
+
+Single-call timings use pytest-benchmark (warmup, calibration and
+saved baselines); see ``make test-performance``. The 16MB throughput
+benchmark is opt-in: ``pytest tests/performance -m throughput``.
 """
 
+import concurrent.futures
+import os
 import time
+from typing import Optional
 
 import pytest
 
 from mdb_engine.core.encryption import EnvelopeEncryptionService
 
+# ---------------------------------------------------------------------------
+# Process-pool helpers
+#
+# The concurrent tests run in worker processes so they scale across cores
+# instead of contending for the GIL around each crypto call. The service is
+# not shipped to workers; each worker rebuilds it from the raw key bytes.
+# ---------------------------------------------------------------------------
 
-@pytest.fixture
-def encryption_service():
-    """Create encryption service with test master key."""
-    master_key = EnvelopeEncryptionService.generate_master_key()
-    import base64
+_worker_service = None
 
-    key_bytes = base64.b64decode(master_key.encode())
-    return EnvelopeEncryptionService(key_bytes)
+# Secrets per task: each worker trip encrypts/decrypts a whole batch
+_BATCH_SIZE = 10
 
 
-class TestEncryptionPerformance:
-    """Test encryption performance targets."""
+def _init_worker(key_bytes: bytes) -> None:
+    global _worker_service
+    _worker_service = EnvelopeEncryptionService(key_bytes)
 
-    def test_encrypt_performance(self, encryption_service):
-        """Test encryption performance (target: < 10ms)."""
-        secret = "test_secret_token_12345"
 
-        start = time.perf_counter()
-        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
-        elapsed = (time.perf_counter() - start) * 1000  # Convert to milliseconds
+def _encrypt_batch(secrets):
+    return [_worker_service.encrypt_secret(secret) for secret in secrets]
 
-        assert elapsed < 10, f"Encryption took {elapsed:.2f}ms, target is < 10ms"
-        assert encrypted_secret is not None
-        assert encrypted_dek is not None
 
-    def test_decrypt_performance(self, encryption_service):
-        """Test decryption performance (target: < 10ms)."""
-        secret = "test_secret_token_12345"
-        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
+def _decrypt_batch(pairs):
+    return [_worker_service.decrypt_secret(secret, dek) for secret, dek in pairs]
 
-        start = time.perf_counter()
-        decrypted = encryption_service.decrypt_secret(encrypted_secret, encrypted_dek)
-        elapsed = (time.perf_counter() - start) * 1000  # Convert to milliseconds
 
-        assert elapsed < 10, f"Decryption took {elapsed:.2f}ms, target is < 10ms"
-        assert decrypted == secret
+def _noop(_):
+    return None
 
-    def test_encrypt_decrypt_roundtrip_performance(self, encryption_service):
-        """Test full encrypt/decrypt roundtrip performance."""
-        secret = "test_secret_token_12345"
 
-        start = time.perf_counter()
-        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
-        decrypted = encryption_service.decrypt_secret(encrypted_secret, encrypted_dek)
-        elapsed = (time.perf_counter() - start) * 1000  # Convert to milliseconds
+def _chunks(items, size=_BATCH_SIZE):
+    return [items[i : i + size] for i in range(0, len(items), size)]
 
-        assert elapsed < 20, f"Roundtrip took {elapsed:.2f}ms, target is < 20ms"
-        assert decrypted == secret
 
-    def test_concurrent_encryption(self, encryption_service):
-        """Test concurrent encryption operations."""
-        import concurrent.futures
+def _worker_pool(
+    key_bytes: bytes, max_workers: Optional[int] = None
+) -> concurrent.futures.ProcessPoolExecutor:
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(key_bytes,),
+    )
 
-        secrets = [f"secret_{i}" for i in range(100)]
 
-        start = time.perf_counter()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [
-                executor.submit(encryption_service.encrypt_secret, secret) for secret in secrets
-            ]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
-        elapsed = (time.perf_counter() - start) * 1000
+def _assert_best_under(benchmark, target_ms: float, label: str) -> None:
+    """Check the fastest benchmarked call (skipped when benchmarking is disabled, e.g. xdist)."""
+    if benchmark.disabled:
+        return
+    best = benchmark.stats.stats.min * 1000
+    assert best < target_ms, f"{label} took {best:.2f}ms, target is < {target_ms:g}ms"
 
-        # Average should be < 10ms per operation
-        avg_time = elapsed / len(secrets)
-        assert avg_time < 10, f"Average encryption time: {avg_time:.2f}ms, target is < 10ms"
-        assert len(results) == len(secrets)
-
-    def test_concurrent_decryption(self, encryption_service):
-        """Test concurrent decryption operations."""
-        import concurrent.futures
-
-        # Pre-encrypt secrets
-        encrypted_pairs = [encryption_service.encrypt_secret(f"secret_{i}") for i in range(100)]
-
-        start = time.perf_counter()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [
-                executor.submit(encryption_service.decrypt_secret, encrypted_secret, encrypted_dek)
-                for encrypted_secret, encrypted_dek in encrypted_pairs
-            ]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
-        elapsed = (time.perf_counter() - start) * 1000
+
+class TestEncryptionPerformance:
+    """Test encryption performance targets."""
+
+    @pytest.mark.parametrize("size", [16, 1024])
+    @pytest.mark.parametrize("op, target_ms", [("encrypt", 10), ("decrypt", 10), ("roundtrip", 20)])
+    def test_operation_performance(self, benchmark, encryption_service, op, target_ms, size):
+        """Test single-call encrypt/decrypt/roundtrip performance per secret size."""
+        secret = "x" * size
+        # Ciphertext for the decrypt case is prepared outside the timed call
+        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
+
+        def roundtrip():
+            return encryption_service.decrypt_secret(*encryption_service.encrypt_secret(secret))
+
+        operations = {
+            "encrypt": (encryption_service.encrypt_secret, (secret,)),
+            "decrypt": (encryption_service.decrypt_secret, (encrypted_secret, encrypted_dek)),
+            "roundtrip": (roundtrip, ()),
+        }
+        func, args = operations[op]
+
+        benchmark.group = op
+        result = benchmark(func, *args)
+
+        _assert_best_under(benchmark, target_ms, f"{op.capitalize()} ({size} chars)")
+        if op == "encrypt":
+            assert encryption_service.decrypt_secret(*result) == secret
+        else:
+            assert result == secret
+
+    @pytest.mark.parametrize("workers", [1, os.cpu_count()], ids=["1-worker", "all-cores"])
+    @pytest.mark.parametrize("op", ["encrypt", "decrypt"])
+    def test_concurrent_performance(
+        self, encryption_service, encrypted_corpus, master_key_bytes, op, workers
+    ):
+        """Test encryption/decryption throughput across worker processes."""
+        if op == "encrypt":
+            batch_func, items = _encrypt_batch, [f"secret_{i}" for i in range(100)]
+        else:
+            batch_func, items = _decrypt_batch, encrypted_corpus
+
+        with _worker_pool(master_key_bytes, workers) as executor:
+            # Spawn and initialize the workers before timing
+            list(executor.map(_noop, range(workers)))
+
+            start = time.perf_counter()
+            batches = executor.map(batch_func, _chunks(items))
+            results = [result for batch in batches for result in batch]
+            elapsed = (time.perf_counter() - start) * 1000
 
         # Average should be < 10ms per operation
-        avg_time = elapsed / len(encrypted_pairs)
-        assert avg_time < 10, f"Average decryption time: {avg_time:.2f}ms, target is < 10ms"
-        assert len(results) == len(encrypted_pairs)
+        avg_time = elapsed / len(items)
+        assert avg_time < 10, f"Average {op} time: {avg_time:.2f}ms, target is < 10ms"
+        # executor.map preserves input order, so results line up with the inputs
+        if op == "encrypt":
+            results = [encryption_service.decrypt_secret(*pair) for pair in results]
+        assert results == [f"secret_{i}" for i in range(len(items))]
+
+
+@pytest.mark.throughput
+class TestEncryptionThroughput:
+    """Bulk encryption throughput, to catch regressions on large payloads (``-m throughput``)."""
+
+    def test_encrypt_throughput(self, benchmark, encryption_service):
+        """Benchmark encrypting a 16MB secret and report MB/s."""
+        size = 16 * 1024 * 1024
+        secret = "x" * size
+
+        benchmark.group = "throughput"
+        result = benchmark(encryption_service.encrypt_secret, secret)
+
+        if not benchmark.disabled:
+            benchmark.extra_info["mb_per_s"] = round(size / 2**20 / benchmark.stats.stats.mean, 1)
+        assert encryption_service.decrypt_secret(*result) == secret
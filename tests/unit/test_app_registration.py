@@ -4,13 +4,36 @@ Unit tests for AppRegistrationManager.
 Tests app registration, validation, callbacks, and reload functionality.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from pymongo.errors import ConnectionFailure, InvalidOperation, OperationFailure
 
 from mdb_engine.core.app_registration import AppRegistrationManager
 from mdb_engine.core.manifest import ManifestParser, ManifestValidator
 
+# Shared, read-only result of a successful apps_config.replace_one()
+_REPLACE_ONE_RESULT = SimpleNamespace(modified_count=1, upserted_id="test_id")
+
+# Callback that always fails; reset by the ``error_callback`` fixture
+_ERROR_CALLBACK = AsyncMock(side_effect=Exception("Callback error"))
+
+
+class _StubCursor:
+    """Minimal stand-in for ``find(...).limit(n).to_list(None)`` returning ``docs``."""
+
+    def __init__(self, docs):
+        self._docs = docs
+
+    def limit(self, n):
+        return self
+
+    async def to_list(self, length):
+        return self._docs
+
 
 @pytest.fixture
 def app_registration_manager(mock_mongo_database):
@@ -24,10 +47,42 @@ def app_registration_manager(mock_mongo_database):
     )
 
 
+@pytest.fixture(scope="module")
+def _collection_template():
+    """
+    Build the ``apps_config`` collection mock once per module.
+
+    The autouse ``apps_collection`` fixture resets it before every test.
+    """
+    collection = MagicMock()
+    collection.replace_one = AsyncMock()
+    collection.find_one = AsyncMock()
+    collection.insert_one = AsyncMock()
+    collection.find = MagicMock()
+    return collection
+
+
+@pytest.fixture(autouse=True)
+def apps_collection(_collection_template, mock_mongo_database):
+    """Reset the shared collection mock and wire it in as ``apps_config``."""
+    collection = _collection_template
+    collection.reset_mock(return_value=True, side_effect=True)
+    collection.replace_one.return_value = _REPLACE_ONE_RESULT
+    collection.find_one.return_value = None
+    mock_mongo_database.apps_config = collection
+    return collection
+
+
+@pytest.fixture
+def error_callback():
+    """The shared failing callback, with its call history cleared."""
+    _ERROR_CALLBACK.reset_mock()
+    return _ERROR_CALLBACK
+
+
 class TestAppRegistrationErrorHandling:
     """Test error handling in app registration."""
 
-    @pytest.mark.asyncio
     async def test_validate_manifest_exception_handling(
         self, app_registration_manager, sample_manifest
     ):
@@ -41,9 +96,8 @@ class TestAppRegistrationErrorHandling:
             with pytest.raises(Exception, match="Validation error"):
                 await app_registration_manager.validate_manifest(sample_manifest)
 
-    @pytest.mark.asyncio
     async def test_register_app_callback_errors(
-        self, app_registration_manager, sample_manifest, mock_mongo_database
+        self, app_registration_manager, sample_manifest, error_callback
     ):
         """Test handling callback execution errors."""
         # Mock successful validation - validate is a sync method that returns a tuple
@@ -52,20 +106,6 @@ class TestAppRegistrationErrorHandling:
             "validate",
             return_value=(True, None, None),
         ):
-            # Mock database operations
-            mock_collection = MagicMock()
-            mock_collection.replace_one = AsyncMock(
-                return_value=MagicMock(modified_count=1, upserted_id="test_id")
-            )
-            mock_mongo_database.__getitem__ = lambda name: mock_collection
-            app_registration_manager.mongo_db = mock_mongo_database
-            # Also need to set apps_config attribute
-            app_registration_manager._mongo_db = mock_mongo_database
-            mock_mongo_database.apps_config = mock_collection
-
-            # Mock callbacks that raise errors
-            error_callback = AsyncMock(side_effect=Exception("Callback error"))
-
             result = await app_registration_manager.register_app(
                 sample_manifest,
                 create_indexes_callback=error_callback,
@@ -79,12 +119,20 @@ class TestAppRegistrationErrorHandling:
             assert result is True
             assert sample_manifest["slug"] in app_registration_manager._apps
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ConnectionFailure("Connection failed"),
+            OperationFailure("Operation failed"),
+            InvalidOperation("Client closed"),
+        ],
+        ids=lambda e: type(e).__name__,
+    )
     async def test_register_app_persistence_errors(
-        self, app_registration_manager, sample_manifest, mock_mongo_database
+        self, app_registration_manager, sample_manifest, apps_collection, error
     ):
         """Test handling MongoDB persistence errors."""
-        from pymongo.errors import ConnectionFailure, InvalidOperation, OperationFailure
+        apps_collection.replace_one.side_effect = error
 
         # Mock successful validation
         with patch.object(
@@ -92,91 +140,45 @@ class TestAppRegistrationErrorHandling:
             "validate",
             return_value=(True, None, None),
         ):
-            mock_collection = MagicMock()
-            # Test ConnectionFailure
-            mock_collection.replace_one = AsyncMock(
-                side_effect=ConnectionFailure("Connection failed")
-            )
-            mock_mongo_database.__getitem__ = lambda name: mock_collection
-            mock_mongo_database.apps_config = mock_collection
-            app_registration_manager.mongo_db = mock_mongo_database
-            app_registration_manager._mongo_db = mock_mongo_database
-
             result = await app_registration_manager.register_app(sample_manifest)
-            # Should still register app in memory even if persistence fails
-            assert result is True
-            assert sample_manifest["slug"] in app_registration_manager._apps
-
-            # Test OperationFailure
-            mock_collection.replace_one = AsyncMock(
-                side_effect=OperationFailure("Operation failed")
-            )
-            result = await app_registration_manager.register_app(sample_manifest)
-            assert result is True
-
-            # Test InvalidOperation
-            mock_collection.replace_one = AsyncMock(side_effect=InvalidOperation("Client closed"))
-            result = await app_registration_manager.register_app(sample_manifest)
-            assert result is True
 
-    @pytest.mark.asyncio
+        # Should still register app in memory even if persistence fails
+        assert result is True
+        assert sample_manifest["slug"] in app_registration_manager._apps
+        apps_collection.replace_one.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            AttributeError("No module"),
+            ImportError("Import failed"),
+            RuntimeError("Runtime error"),
+        ],
+        ids=lambda e: type(e).__name__,
+    )
     async def test_register_app_auth_cache_invalidation_error(
-        self, app_registration_manager, sample_manifest, mock_mongo_database
+        self, app_registration_manager, sample_manifest, monkeypatch, error
     ):
         """Test handling auth cache invalidation errors."""
+        invalidate = Mock(side_effect=error)
+        monkeypatch.setattr("mdb_engine.auth.integration.invalidate_auth_config_cache", invalidate)
         # Mock successful validation
-        with patch.object(
+        monkeypatch.setattr(
             app_registration_manager.manifest_validator,
             "validate",
-            return_value=(True, None, None),
-        ):
-            mock_collection = MagicMock()
-            mock_collection.replace_one = AsyncMock(
-                return_value=MagicMock(modified_count=1, upserted_id="test_id")
-            )
-            mock_mongo_database.__getitem__ = lambda name: mock_collection
-            mock_mongo_database.apps_config = mock_collection
-            app_registration_manager.mongo_db = mock_mongo_database
-            app_registration_manager._mongo_db = mock_mongo_database
-
-            # Mock auth integration to raise errors - the function is imported from auth.integration
-            # Test AttributeError (function doesn't exist in module)
-            with patch(
-                "mdb_engine.auth.integration.invalidate_auth_config_cache",
-                side_effect=AttributeError("No module"),
-            ):
-                result = await app_registration_manager.register_app(sample_manifest)
-                assert result is True
+            Mock(return_value=(True, None, None)),
+        )
 
-            # Test ImportError (module import fails)
-            import sys
+        result = await app_registration_manager.register_app(sample_manifest)
 
-            original_auth = sys.modules.get("mdb_engine.auth.integration")
-            try:
-                if "mdb_engine.auth.integration" in sys.modules:
-                    del sys.modules["mdb_engine.auth.integration"]
-                result = await app_registration_manager.register_app(sample_manifest)
-                assert result is True
-            finally:
-                if original_auth:
-                    sys.modules["mdb_engine.auth.integration"] = original_auth
-
-            # Test RuntimeError
-            with patch(
-                "mdb_engine.auth.integration.invalidate_auth_config_cache",
-                side_effect=RuntimeError("Runtime error"),
-            ):
-                result = await app_registration_manager.register_app(sample_manifest)
-                assert result is True
+        assert result is True
+        invalidate.assert_called_once_with(sample_manifest["slug"])
 
 
 class TestAppRegistrationEdgeCases:
     """Test edge cases in app registration."""
 
-    @pytest.mark.asyncio
-    async def test_register_app_with_callbacks(
-        self, app_registration_manager, sample_manifest, mock_mongo_database
-    ):
+    async def test_register_app_with_callbacks(self, app_registration_manager, sample_manifest):
         """Test registering app with all callback types."""
         # Mock successful validation - validate is a sync method that returns a tuple
         with patch.object(
@@ -184,17 +186,6 @@ class TestAppRegistrationEdgeCases:
             "validate",
             return_value=(True, None, None),
         ):
-            # Mock database operations
-            mock_collection = MagicMock()
-            mock_collection.replace_one = AsyncMock(
-                return_value=MagicMock(modified_count=1, upserted_id="test_id")
-            )
-            mock_mongo_database.__getitem__ = lambda name: mock_collection
-            app_registration_manager.mongo_db = mock_mongo_database
-            # Also need to set apps_config attribute
-            app_registration_manager._mongo_db = mock_mongo_database
-            mock_mongo_database.apps_config = mock_collection
-
             # Create callbacks
             create_indexes_callback = AsyncMock()
             seed_data_callback = AsyncMock()
@@ -230,9 +221,8 @@ class TestAppRegistrationEdgeCases:
             register_websockets_callback.assert_called_once()
             setup_observability_callback.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_register_app_callback_failures(
-        self, app_registration_manager, sample_manifest, mock_mongo_database
+        self, app_registration_manager, sample_manifest, error_callback
     ):
         """Test handling callback failures gracefully."""
         # Mock successful validation - validate is a sync method that returns a tuple
@@ -241,54 +231,26 @@ class TestAppRegistrationEdgeCases:
             "validate",
             return_value=(True, None, None),
         ):
-            # Mock database operations
-            mock_collection = MagicMock()
-            mock_collection.replace_one = AsyncMock(
-                return_value=MagicMock(modified_count=1, upserted_id="test_id")
-            )
-            mock_mongo_database.__getitem__ = lambda name: mock_collection
-            app_registration_manager.mongo_db = mock_mongo_database
-            # Also need to set apps_config attribute
-            app_registration_manager._mongo_db = mock_mongo_database
-            mock_mongo_database.apps_config = mock_collection
-
-            # Callbacks that fail
-            failing_callback = AsyncMock(side_effect=Exception("Callback failed"))
-
             result = await app_registration_manager.register_app(
                 sample_manifest,
-                create_indexes_callback=failing_callback,
-                seed_data_callback=failing_callback,
+                create_indexes_callback=error_callback,
+                seed_data_callback=error_callback,
             )
 
             # Should still register app
             assert result is True
             assert sample_manifest["slug"] in app_registration_manager._apps
 
-    @pytest.mark.asyncio
     async def test_register_app_callbacks_run_in_parallel(
-        self, app_registration_manager, sample_manifest, mock_mongo_database
+        self, app_registration_manager, sample_manifest
     ):
         """Test that callbacks run in parallel, not sequentially."""
-        import asyncio
-        import time
-
         # Mock successful validation
         with patch.object(
             app_registration_manager.manifest_validator,
             "validate",
             return_value=(True, None, None),
         ):
-            # Mock database operations
-            mock_collection = MagicMock()
-            mock_collection.replace_one = AsyncMock(
-                return_value=MagicMock(modified_count=1, upserted_id="test_id")
-            )
-            mock_mongo_database.__getitem__ = lambda name: mock_collection
-            app_registration_manager.mongo_db = mock_mongo_database
-            app_registration_manager._mongo_db = mock_mongo_database
-            mock_mongo_database.apps_config = mock_collection
-
             # Track callback execution times
             callback_times = {}
 
@@ -342,9 +304,8 @@ class TestAppRegistrationEdgeCases:
             assert "seed" in callback_times
             assert "memory" in callback_times
 
-    @pytest.mark.asyncio
     async def test_register_app_one_failing_callback_doesnt_block_others(
-        self, app_registration_manager, sample_manifest, mock_mongo_database
+        self, app_registration_manager, sample_manifest
     ):
         """Test that one failing callback doesn't prevent others from running."""
         # Mock successful validation
@@ -353,16 +314,6 @@ class TestAppRegistrationEdgeCases:
             "validate",
             return_value=(True, None, None),
         ):
-            # Mock database operations
-            mock_collection = MagicMock()
-            mock_collection.replace_one = AsyncMock(
-                return_value=MagicMock(modified_count=1, upserted_id="test_id")
-            )
-            mock_mongo_database.__getitem__ = lambda name: mock_collection
-            app_registration_manager.mongo_db = mock_mongo_database
-            app_registration_manager._mongo_db = mock_mongo_database
-            mock_mongo_database.apps_config = mock_collection
-
             # Track which callbacks executed
             executed_callbacks = []
 
@@ -397,9 +348,8 @@ class TestAppRegistrationEdgeCases:
             assert "success" in executed_callbacks
             assert len(executed_callbacks) == 2
 
-    @pytest.mark.asyncio
     async def test_register_app_callback_exceptions_logged_not_raised(
-        self, app_registration_manager, sample_manifest, mock_mongo_database
+        self, app_registration_manager, sample_manifest
     ):
         """Test that callback exceptions are logged but don't fail registration."""
         # Mock successful validation
@@ -408,16 +358,6 @@ class TestAppRegistrationEdgeCases:
             "validate",
             return_value=(True, None, None),
         ):
-            # Mock database operations
-            mock_collection = MagicMock()
-            mock_collection.replace_one = AsyncMock(
-                return_value=MagicMock(modified_count=1, upserted_id="test_id")
-            )
-            mock_mongo_database.__getitem__ = lambda name: mock_collection
-            app_registration_manager.mongo_db = mock_mongo_database
-            app_registration_manager._mongo_db = mock_mongo_database
-            mock_mongo_database.apps_config = mock_collection
-
             # Create failing callback
             failing_callback = AsyncMock(side_effect=ValueError("Test error"))
 
@@ -443,21 +383,10 @@ class TestAppRegistrationEdgeCases:
                 warning_call = mock_logger.warning.call_args[0][0]
                 assert "Callback" in warning_call and "failed" in warning_call
 
-    @pytest.mark.asyncio
-    async def test_reload_apps_empty(self, app_registration_manager, mock_mongo_database):
+    async def test_reload_apps_empty(self, app_registration_manager, apps_collection):
         """Test reloading when no apps exist."""
         # Mock empty cursor - find() returns a cursor, then limit(), then to_list()
-        mock_cursor = MagicMock()
-        mock_cursor.limit = MagicMock(return_value=mock_cursor)
-        mock_cursor.to_list = AsyncMock(return_value=[])
-        mock_collection = MagicMock()
-        # find() is NOT async - it returns a cursor immediately
-        mock_collection.find = MagicMock(return_value=mock_cursor)
-        mock_mongo_database.__getitem__ = lambda name: mock_collection
-        mock_mongo_database.apps_config = mock_collection
-
-        app_registration_manager.mongo_db = mock_mongo_database
-        app_registration_manager._mongo_db = mock_mongo_database
+        apps_collection.find.return_value = _StubCursor([])
 
         register_callback = AsyncMock()
         count = await app_registration_manager.reload_apps(register_app_callback=register_callback)
@@ -465,29 +394,16 @@ class TestAppRegistrationEdgeCases:
         assert count == 0
         register_callback.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_reload_apps_with_errors(
-        self, app_registration_manager, mock_mongo_database, sample_manifest
+        self, app_registration_manager, apps_collection, sample_manifest
     ):
         """Test handling errors during app reload."""
         # Mock cursor with apps - find() returns cursor, then limit(), then to_list()
         # The code does: await self._mongo_db.apps_config.find(...).limit(500).to_list(None)
         # So find() must return a cursor (not async), limit() returns cursor, to_list() is async
-        mock_cursor = MagicMock()
-        mock_cursor.limit = MagicMock(return_value=mock_cursor)
-        mock_cursor.to_list = AsyncMock(return_value=[sample_manifest])
-        mock_collection = MagicMock()
-        # find() is NOT async - it returns a cursor immediately
-        mock_collection.find = MagicMock(return_value=mock_cursor)
-        mock_mongo_database.__getitem__ = lambda name: mock_collection
-        mock_mongo_database.apps_config = mock_collection
-
-        app_registration_manager.mongo_db = mock_mongo_database
-        app_registration_manager._mongo_db = mock_mongo_database
+        apps_collection.find.return_value = _StubCursor([sample_manifest])
 
         # Callback that fails with a MongoDB exception (which will be caught)
-        from pymongo.errors import OperationFailure
-
         failing_callback = AsyncMock(side_effect=OperationFailure("Registration failed"))
 
         # Should handle MongoDB errors gracefully and return 0
@@ -497,23 +413,12 @@ class TestAppRegistrationEdgeCases:
         # Should return 0 when MongoDB errors occur
         assert count == 0
 
-    @pytest.mark.asyncio
     async def test_reload_apps_success(
-        self, app_registration_manager, mock_mongo_database, sample_manifest
+        self, app_registration_manager, apps_collection, sample_manifest
     ):
         """Test successful app reload."""
         # Mock cursor with apps - find() returns cursor, then limit(), then to_list()
-        mock_cursor = MagicMock()
-        mock_cursor.limit = MagicMock(return_value=mock_cursor)
-        mock_cursor.to_list = AsyncMock(return_value=[sample_manifest])
-        mock_collection = MagicMock()
-        # find() is NOT async - it returns a cursor immediately
-        mock_collection.find = MagicMock(return_value=mock_cursor)
-        mock_mongo_database.__getitem__ = lambda name: mock_collection
-        mock_mongo_database.apps_config = mock_collection
-
-        app_registration_manager.mongo_db = mock_mongo_database
-        app_registration_manager._mongo_db = mock_mongo_database
+        apps_collection.find.return_value = _StubCursor([sample_manifest])
 
         # Mock successful validation
         app_registration_manager.manifest_validator.validate = AsyncMock(
@@ -7,6 +7,7 @@ This module is part of MDB_ENGINE - MongoDB Engine.
 """
 
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -18,41 +19,86 @@ from mdb_engine.auth.audit import (
     AuthAuditLog,
 )
 
+# Fixed clock for the shared audit log, so timestamps can be asserted exactly
+_FIXED_NOW = datetime(2024, 1, 1)
 
-class TestAuthAction:
-    """Tests for AuthAction enum."""
 
-    def test_login_success_value(self):
-        """Test LOGIN_SUCCESS action value."""
-        assert AuthAction.LOGIN_SUCCESS.value == "login_success"
+def _fields(doc, expected):
+    """The part of ``doc`` covering ``expected``'s keys, for a single dict comparison."""
+    return {key: doc.get(key) for key in expected}
+
+
+class _StubCursor:
+    """Minimal stand-in for ``find(...).sort(...).limit(n)`` / ``aggregate(...)`` cursors."""
+
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def limit(self, n):
+        return self
 
-    def test_login_failed_value(self):
-        """Test LOGIN_FAILED action value."""
-        assert AuthAction.LOGIN_FAILED.value == "login_failed"
+    async def to_list(self, length=None):
+        return self._docs
 
-    def test_logout_value(self):
-        """Test LOGOUT action value."""
-        assert AuthAction.LOGOUT.value == "logout"
 
-    def test_register_value(self):
-        """Test REGISTER action value."""
-        assert AuthAction.REGISTER.value == "register"
+class _StubCollection:
+    """Audit collection stub that records the documents passed to ``insert_one``."""
 
-    def test_token_revoked_value(self):
-        """Test TOKEN_REVOKED action value."""
-        assert AuthAction.TOKEN_REVOKED.value == "token_revoked"
+    def __init__(self):
+        self.inserted = []
 
-    def test_role_granted_value(self):
-        """Test ROLE_GRANTED action value."""
-        assert AuthAction.ROLE_GRANTED.value == "role_granted"
+    async def insert_one(self, doc):
+        self.inserted.append(doc)
+        return SimpleNamespace(inserted_id="test_id")
 
-    def test_role_revoked_value(self):
-        """Test ROLE_REVOKED action value."""
-        assert AuthAction.ROLE_REVOKED.value == "role_revoked"
 
-    def test_rate_limit_exceeded_value(self):
-        """Test RATE_LIMIT_EXCEEDED action value."""
-        assert AuthAction.RATE_LIMIT_EXCEEDED.value == "rate_limit_exceeded"
+@pytest.fixture
+def audit_mock_db():
+    """``(db, collection)`` mocks where ``db[AUDIT_COLLECTION]`` is the AsyncMock collection."""
+    mock_collection = AsyncMock()
+    mock_db = MagicMock()
+    mock_db.__getitem__.return_value = mock_collection
+    return mock_db, mock_collection
+
+
+@pytest.fixture(scope="class")
+def _audit_log():
+    """Audit log over a stub collection, built once per test class."""
+    audit = AuthAuditLog({AUDIT_COLLECTION: _StubCollection()}, clock=lambda: _FIXED_NOW)
+    audit._indexes_created = True  # Skip index creation
+    return audit
+
+
+@pytest.fixture
+def audit_log(_audit_log):
+    """The class's shared audit log, with previously inserted documents cleared."""
+    _audit_log._collection.inserted.clear()
+    return _audit_log
+
+
+class TestAuthAction:
+    """Tests for AuthAction enum."""
+
+    @pytest.mark.parametrize(
+        "action, expected",
+        [
+            (AuthAction.LOGIN_SUCCESS, "login_success"),
+            (AuthAction.LOGIN_FAILED, "login_failed"),
+            (AuthAction.LOGOUT, "logout"),
+            (AuthAction.REGISTER, "register"),
+            (AuthAction.TOKEN_REVOKED, "token_revoked"),
+            (AuthAction.ROLE_GRANTED, "role_granted"),
+            (AuthAction.ROLE_REVOKED, "role_revoked"),
+            (AuthAction.RATE_LIMIT_EXCEEDED, "rate_limit_exceeded"),
+        ],
+        ids=lambda v: v.name if isinstance(v, AuthAction) else None,
+    )
+    def test_action_value(self, action, expected):
+        """Test each action's stored value."""
+        assert action.value == expected
 
     def test_all_actions_are_strings(self):
         """Test that all actions are string enums."""
@@ -89,30 +135,25 @@ class TestAuthAuditLogInit:
 class TestAuthAuditLogEnsureIndexes:
     """Tests for AuthAuditLog.ensure_indexes method."""
 
-    @pytest.mark.asyncio
-    async def test_creates_indexes(self):
+    async def test_creates_indexes(self, audit_mock_db):
         """Test that indexes are created."""
-        mock_db = MagicMock()
-        mock_collection = AsyncMock()
-        mock_db.__getitem__.return_value = mock_collection
-
+        mock_db, mock_collection = audit_mock_db
         audit_log = AuthAuditLog(mock_db)
         await audit_log.ensure_indexes()
 
         assert mock_collection.create_index.call_count >= 4  # At least 4 indexes
         assert audit_log._indexes_created is True
 
-    @pytest.mark.asyncio
-    async def test_skips_if_already_created(self):
+    def test_skips_if_already_created(self, audit_mock_db):
         """Test that indexes are not recreated."""
-        mock_db = MagicMock()
-        mock_collection = AsyncMock()
-        mock_db.__getitem__.return_value = mock_collection
-
+        mock_db, mock_collection = audit_mock_db
         audit_log = AuthAuditLog(mock_db)
         audit_log._indexes_created = True
 
-        await audit_log.ensure_indexes()
+        # The early return never suspends, so the coroutine completes on its first
+        # step and needs no event loop
+        with pytest.raises(StopIteration):
+            audit_log.ensure_indexes().send(None)
 
         mock_collection.create_index.assert_not_called()
 
@@ -120,19 +161,6 @@ class TestAuthAuditLogEnsureIndexes:
 class TestAuthAuditLogEvents:
     """Tests for AuthAuditLog.log_event method."""
 
-    @pytest.fixture
-    def audit_log(self):
-        """Create audit log with mocked collection."""
-        mock_db = MagicMock()
-        mock_collection = AsyncMock()
-        mock_collection.insert_one.return_value = MagicMock(inserted_id="test_id")
-        mock_db.__getitem__.return_value = mock_collection
-
-        audit = AuthAuditLog(mock_db)
-        audit._indexes_created = True  # Skip index creation
-        return audit
-
-    @pytest.mark.asyncio
     async def test_log_event_basic(self, audit_log):
         """Test logging a basic event."""
         doc_id = await audit_log.log_event(
@@ -142,14 +170,12 @@ class TestAuthAuditLogEvents:
         )
 
         assert doc_id == "test_id"
-        audit_log._collection.insert_one.assert_called_once()
+        assert len(audit_log._collection.inserted) == 1
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["action"] == "login_success"
-        assert call_args["success"] is True
-        assert call_args["user_email"] == "test@example.com"
+        doc = audit_log._collection.inserted[-1]
+        expected = {"action": "login_success", "success": True, "user_email": "test@example.com"}
+        assert _fields(doc, expected) == expected
 
-    @pytest.mark.asyncio
     async def test_log_event_with_details(self, audit_log):
         """Test logging event with all details."""
         doc_id = await audit_log.log_event(
@@ -163,14 +189,16 @@ class TestAuthAuditLogEvents:
             details={"reason": "invalid_password"},
         )
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["user_id"] == "user_123"
-        assert call_args["app_slug"] == "my_app"
-        assert call_args["ip_address"] == "192.168.1.1"
-        assert call_args["user_agent"] == "Mozilla/5.0"
-        assert call_args["details"]["reason"] == "invalid_password"
+        doc = audit_log._collection.inserted[-1]
+        expected = {
+            "user_id": "user_123",
+            "app_slug": "my_app",
+            "ip_address": "192.168.1.1",
+            "user_agent": "Mozilla/5.0",
+            "details": {"reason": "invalid_password"},
+        }
+        assert _fields(doc, expected) == expected
 
-    @pytest.mark.asyncio
     async def test_log_event_sets_expiry(self, audit_log):
         """Test that expires_at is set correctly."""
         await audit_log.log_event(
@@ -178,32 +206,14 @@ class TestAuthAuditLogEvents:
             success=True,
         )
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert "expires_at" in call_args
-        assert "timestamp" in call_args
-
-        # Expiry should be ~90 days from now
-        expected_expiry = datetime.utcnow() + timedelta(days=90)
-        actual_expiry = call_args["expires_at"]
-        assert abs((expected_expiry - actual_expiry).total_seconds()) < 5
+        doc = audit_log._collection.inserted[-1]
+        assert doc["timestamp"] == _FIXED_NOW
+        assert doc["expires_at"] == _FIXED_NOW + timedelta(days=DEFAULT_RETENTION_DAYS)
 
 
 class TestAuthAuditLogConvenience:
     """Tests for convenience methods."""
 
-    @pytest.fixture
-    def audit_log(self):
-        """Create audit log with mocked collection."""
-        mock_db = MagicMock()
-        mock_collection = AsyncMock()
-        mock_collection.insert_one.return_value = MagicMock(inserted_id="test_id")
-        mock_db.__getitem__.return_value = mock_collection
-
-        audit = AuthAuditLog(mock_db)
-        audit._indexes_created = True
-        return audit
-
-    @pytest.mark.asyncio
     async def test_log_login_success(self, audit_log):
         """Test log_login_success convenience method."""
         await audit_log.log_login_success(
@@ -212,11 +222,10 @@ class TestAuthAuditLogConvenience:
             app_slug="my_app",
         )
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["action"] == "login_success"
-        assert call_args["success"] is True
+        doc = audit_log._collection.inserted[-1]
+        expected = {"action": "login_success", "success": True}
+        assert _fields(doc, expected) == expected
 
-    @pytest.mark.asyncio
     async def test_log_login_failed(self, audit_log):
         """Test log_login_failed convenience method."""
         await audit_log.log_login_failed(
@@ -225,12 +234,14 @@ class TestAuthAuditLogConvenience:
             ip_address="192.168.1.1",
         )
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["action"] == "login_failed"
-        assert call_args["success"] is False
-        assert call_args["details"]["reason"] == "invalid_password"
+        doc = audit_log._collection.inserted[-1]
+        expected = {
+            "action": "login_failed",
+            "success": False,
+            "details": {"reason": "invalid_password"},
+        }
+        assert _fields(doc, expected) == expected
 
-    @pytest.mark.asyncio
     async def test_log_logout(self, audit_log):
         """Test log_logout convenience method."""
         await audit_log.log_logout(
@@ -238,11 +249,10 @@ class TestAuthAuditLogConvenience:
             ip_address="192.168.1.1",
         )
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["action"] == "logout"
-        assert call_args["success"] is True
+        doc = audit_log._collection.inserted[-1]
+        expected = {"action": "logout", "success": True}
+        assert _fields(doc, expected) == expected
 
-    @pytest.mark.asyncio
     async def test_log_register(self, audit_log):
         """Test log_register convenience method."""
         await audit_log.log_register(
@@ -251,41 +261,39 @@ class TestAuthAuditLogConvenience:
             user_agent="Mozilla/5.0",
         )
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["action"] == "register"
-        assert call_args["success"] is True
-
-    @pytest.mark.asyncio
-    async def test_log_role_change_grant(self, audit_log):
-        """Test log_role_change for role grant."""
-        await audit_log.log_role_change(
-            email="test@example.com",
-            app_slug="my_app",
-            old_roles=["viewer"],
-            new_roles=["viewer", "editor"],
-            changed_by="admin@example.com",
-        )
-
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["action"] == "role_granted"
-        assert call_args["details"]["old_roles"] == ["viewer"]
-        assert call_args["details"]["new_roles"] == ["viewer", "editor"]
-
-    @pytest.mark.asyncio
-    async def test_log_role_change_revoke(self, audit_log):
-        """Test log_role_change for role revoke."""
+        doc = audit_log._collection.inserted[-1]
+        expected = {"action": "register", "success": True}
+        assert _fields(doc, expected) == expected
+
+    @pytest.mark.parametrize(
+        "old_roles, new_roles, action",
+        [
+            (["viewer"], ["viewer", "editor"], "role_granted"),
+            (["viewer", "editor"], ["viewer"], "role_revoked"),
+        ],
+        ids=["grant", "revoke"],
+    )
+    async def test_log_role_change(self, audit_log, old_roles, new_roles, action):
+        """Test log_role_change for role grant and revoke."""
         await audit_log.log_role_change(
             email="test@example.com",
             app_slug="my_app",
-            old_roles=["viewer", "editor"],
-            new_roles=["viewer"],
+            old_roles=old_roles,
+            new_roles=new_roles,
             changed_by="admin@example.com",
         )
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["action"] == "role_revoked"
+        doc = audit_log._collection.inserted[-1]
+        expected = {
+            "action": action,
+            "details": {
+                "old_roles": old_roles,
+                "new_roles": new_roles,
+                "changed_by": "admin@example.com",
+            },
+        }
+        assert _fields(doc, expected) == expected
 
-    @pytest.mark.asyncio
     async def test_log_token_revoked(self, audit_log):
         """Test log_token_revoked convenience method."""
         await audit_log.log_token_revoked(
@@ -293,11 +301,10 @@ class TestAuthAuditLogConvenience:
             reason="logout",
         )
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["action"] == "token_revoked"
-        assert call_args["details"]["reason"] == "logout"
+        doc = audit_log._collection.inserted[-1]
+        expected = {"action": "token_revoked", "details": {"reason": "logout"}}
+        assert _fields(doc, expected) == expected
 
-    @pytest.mark.asyncio
     async def test_log_rate_limit_exceeded(self, audit_log):
         """Test log_rate_limit_exceeded convenience method."""
         await audit_log.log_rate_limit_exceeded(
@@ -306,43 +313,33 @@ class TestAuthAuditLogConvenience:
             email="test@example.com",
         )
 
-        call_args = audit_log._collection.insert_one.call_args[0][0]
-        assert call_args["action"] == "rate_limit_exceeded"
-        assert call_args["success"] is False
-        assert call_args["details"]["endpoint"] == "/login"
+        doc = audit_log._collection.inserted[-1]
+        expected = {
+            "action": "rate_limit_exceeded",
+            "success": False,
+            "details": {"endpoint": "/login"},
+        }
+        assert _fields(doc, expected) == expected
 
 
 class TestAuthAuditLogQueries:
     """Tests for query methods."""
 
     @pytest.fixture
-    def audit_log(self):
-        """Create audit log with mocked collection."""
-        mock_db = MagicMock()
-        mock_collection = MagicMock()  # Use regular MagicMock for chain methods
-        mock_db.__getitem__.return_value = mock_collection
-
+    def audit_log(self, audit_mock_db):
+        """Create audit log with mocked collection (tests set the query methods they use)."""
+        mock_db, _ = audit_mock_db
         audit = AuthAuditLog(mock_db)
         audit._indexes_created = True
         return audit
 
-    @pytest.mark.asyncio
     async def test_get_recent_events(self, audit_log):
         """Test get_recent_events query."""
-        # Setup chained mock: find().sort().limit() returns async iterable
-        mock_cursor = AsyncMock()
-        mock_cursor.to_list = AsyncMock(
-            return_value=[
-                {"_id": "id1", "action": "login_success"},
-                {"_id": "id2", "action": "login_failed"},
-            ]
-        )
-
-        # Chain the mocks: find() -> sort() -> limit() -> cursor
-        mock_limit = MagicMock(return_value=mock_cursor)
-        mock_sort = MagicMock(return_value=MagicMock(limit=mock_limit))
-        mock_find = MagicMock(return_value=MagicMock(sort=mock_sort))
-        audit_log._collection.find = mock_find
+        docs = [
+            {"_id": "id1", "action": "login_success"},
+            {"_id": "id2", "action": "login_failed"},
+        ]
+        audit_log._collection.find = lambda *args, **kwargs: _StubCursor(docs)
 
         events = await audit_log.get_recent_events(hours=24)
 
@@ -350,7 +347,6 @@ class TestAuthAuditLogQueries:
         assert events[0]["_id"] == "id1"
         assert events[1]["_id"] == "id2"
 
-    @pytest.mark.asyncio
     async def test_count_failed_logins(self, audit_log):
         """Test count_failed_logins query."""
         audit_log._collection.count_documents = AsyncMock(return_value=5)
@@ -363,19 +359,16 @@ class TestAuthAuditLogQueries:
         assert count == 5
         audit_log._collection.count_documents.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_security_summary(self, audit_log):
         """Test get_security_summary aggregation."""
         # Setup mock cursor for aggregation
-        mock_cursor = AsyncMock()
-        mock_cursor.to_list = AsyncMock(
-            return_value=[
+        mock_cursor = _StubCursor(
+            [
                 {"_id": {"action": "login_success", "success": True}, "count": 100},
                 {"_id": {"action": "login_failed", "success": False}, "count": 10},
                 {"_id": {"action": "register", "success": True}, "count": 5},
             ]
         )
-
         audit_log._collection.aggregate = MagicMock(return_value=mock_cursor)
 
         summary = await audit_log.get_security_summary(hours=24)
@@ -6,134 +6,64 @@ Tests that auth.mode field is properly validated and parsed.
 
 from unittest.mock import MagicMock
 
+import pytest
 
-class TestAuthModeManifestSchema:
-    """Tests for auth.mode in manifest schema."""
+from mdb_engine.auth import SharedAuthMiddleware, SharedUserPool, create_shared_auth_middleware
+from mdb_engine.core.manifest import validate_manifest
 
-    def test_auth_mode_app_valid(self):
-        """Test that mode='app' is valid."""
-        from mdb_engine.core.manifest import validate_manifest
 
-        manifest = {
-            "schema_version": "2.0",
-            "slug": "test_app",
-            "name": "Test App",
-            "auth": {
-                "mode": "app",
-            },
-            "data_access": {
-                "read_scopes": ["test_app"],
-                "write_scope": "test_app",
-            },
-        }
+@pytest.fixture(scope="module")
+def base_manifest():
+    """Minimal valid manifest without an ``auth`` block (read-only; overlay with ``{**base}``)."""
+    return {
+        "schema_version": "2.0",
+        "slug": "test_app",
+        "name": "Test App",
+        "data_access": {
+            "read_scopes": ["test_app"],
+            "write_scope": "test_app",
+        },
+    }
 
-        is_valid, error, warnings = validate_manifest(manifest)
-        assert is_valid, f"Expected valid, got error: {error}"
 
-    def test_auth_mode_shared_valid(self):
-        """Test that mode='shared' is valid."""
-        from mdb_engine.core.manifest import validate_manifest
-
-        manifest = {
-            "schema_version": "2.0",
-            "slug": "test_app",
-            "name": "Test App",
-            "auth": {
-                "mode": "shared",
-                "roles": ["viewer", "editor", "admin"],
-                "default_role": "viewer",
-                "require_role": "viewer",
-            },
-            "data_access": {
-                "read_scopes": ["test_app"],
-                "write_scope": "test_app",
-            },
-        }
+class TestAuthModeManifestSchema:
+    """Tests for auth.mode in manifest schema."""
 
-        is_valid, error, warnings = validate_manifest(manifest)
+    @pytest.mark.parametrize(
+        "auth",
+        [
+            pytest.param({"mode": "app"}, id="mode-app"),
+            pytest.param(
+                {
+                    "mode": "shared",
+                    "roles": ["viewer", "editor", "admin"],
+                    "default_role": "viewer",
+                    "require_role": "viewer",
+                },
+                id="mode-shared",
+            ),
+            pytest.param(
+                {"mode": "shared", "public_routes": ["/health", "/api/public/*"]},
+                id="public-routes",
+            ),
+            pytest.param({"mode": "shared", "roles": ["viewer", "editor", "admin"]}, id="roles"),
+            # Default mode is 'app' when not specified
+            pytest.param({}, id="default-mode"),
+        ],
+    )
+    def test_auth_config_valid(self, base_manifest, auth):
+        """Test that valid auth configurations pass validation."""
+        is_valid, error, warnings = validate_manifest({**base_manifest, "auth": auth})
         assert is_valid, f"Expected valid, got error: {error}"
 
-    def test_auth_mode_invalid_value(self):
+    def test_auth_mode_invalid_value(self, base_manifest):
         """Test that invalid mode value fails validation."""
-        from mdb_engine.core.manifest import validate_manifest
-
-        manifest = {
-            "schema_version": "2.0",
-            "slug": "test_app",
-            "name": "Test App",
-            "auth": {
-                "mode": "invalid_mode",
-            },
-            "data_access": {
-                "read_scopes": ["test_app"],
-                "write_scope": "test_app",
-            },
-        }
+        manifest = {**base_manifest, "auth": {"mode": "invalid_mode"}}
 
         is_valid, error, warnings = validate_manifest(manifest)
         assert not is_valid
         assert "mode" in error.lower() or "invalid" in error.lower()
 
-    def test_auth_public_routes_valid(self):
-        """Test that public_routes array is valid."""
-        from mdb_engine.core.manifest import validate_manifest
-
-        manifest = {
-            "schema_version": "2.0",
-            "slug": "test_app",
-            "name": "Test App",
-            "auth": {
-                "mode": "shared",
-                "public_routes": ["/health", "/api/public/*"],
-            },
-            "data_access": {
-                "read_scopes": ["test_app"],
-                "write_scope": "test_app",
-            },
-        }
-
-        is_valid, error, warnings = validate_manifest(manifest)
-        assert is_valid, f"Expected valid, got error: {error}"
-
-    def test_auth_roles_valid(self):
-        """Test that roles array is valid."""
-        from mdb_engine.core.manifest import validate_manifest
-
-        manifest = {
-            "schema_version": "2.0",
-            "slug": "test_app",
-            "name": "Test App",
-            "auth": {
-                "mode": "shared",
-                "roles": ["viewer", "editor", "admin"],
-            },
-            "data_access": {
-                "read_scopes": ["test_app"],
-                "write_scope": "test_app",
-            },
-        }
-
-        is_valid, error, warnings = validate_manifest(manifest)
-        assert is_valid, f"Expected valid, got error: {error}"
-
-    def test_auth_default_mode_is_app(self):
-        """Test that default mode is 'app' when not specified."""
-        from mdb_engine.core.manifest import validate_manifest
-
-        manifest = {
-            "schema_version": "2.0",
-            "slug": "test_app",
-            "name": "Test App",
-            "auth": {},  # No mode specified
-            "data_access": {
-                "read_scopes": ["test_app"],
-                "write_scope": "test_app",
-            },
-        }
-
-        is_valid, error, warnings = validate_manifest(manifest)
-        assert is_valid, f"Expected valid, got error: {error}"
-
 
 class TestAuthModeEngineIntegration:
     """Tests for auth mode handling in MongoDBEngine."""
@@ -184,26 +114,18 @@ class TestSharedAuthExports:
 
     def test_shared_user_pool_exported(self):
         """Test SharedUserPool is exported from auth module."""
-        from mdb_engine.auth import SharedUserPool
-
         assert SharedUserPool is not None
 
     def test_shared_auth_middleware_exported(self):
         """Test SharedAuthMiddleware is exported from auth module."""
-        from mdb_engine.auth import SharedAuthMiddleware
-
         assert SharedAuthMiddleware is not None
 
     def test_create_shared_auth_middleware_exported(self):
         """Test create_shared_auth_middleware is exported from auth module."""
-        from mdb_engine.auth import create_shared_auth_middleware
-
         assert create_shared_auth_middleware is not None
 
     def test_shared_user_pool_can_instantiate(self):
         """Test SharedUserPool can be instantiated with mock db."""
-        from mdb_engine.auth import SharedUserPool
-
         mock_db = MagicMock()
         mock_db.__getitem__ = MagicMock(return_value=MagicMock())
 
@@ -137,6 +137,35 @@ class TestConnectionManagerMetricsRegistration:
                 assert manager._initialized is True
 
 
+class TestConnectionManagerInjectedClient:
+    """Test using an externally owned client."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_uses_injected_client(self, connection_config, mock_mongo_client):
+        """Test that an injected client is used instead of creating one."""
+        with patch("mdb_engine.core.connection.AsyncIOMotorClient") as client_cls:
+            manager = ConnectionManager(**connection_config, mongo_client=mock_mongo_client)
+            await manager.initialize()
+
+        client_cls.assert_not_called()
+        assert manager.mongo_client is mock_mongo_client
+        assert manager.mongo_db.name == "test_db"
+
+    @pytest.mark.asyncio
+    async def test_shutdown_keeps_injected_client_open(self, connection_config, mock_mongo_client):
+        """Test that shutdown leaves closing an injected client to its owner."""
+        manager = ConnectionManager(**connection_config, mongo_client=mock_mongo_client)
+        await manager.initialize()
+        await manager.shutdown()
+
+        mock_mongo_client.close.assert_not_called()
+        assert manager.initialized is False
+
+        # The same client is reused on re-initialization
+        await manager.initialize()
+        assert manager.mongo_client is mock_mongo_client
+
+
 class TestGetSharedClient:
     """Test get_shared_client function."""
 
@@ -8,11 +8,11 @@ Tests cover:
 - Cookie and header handling
 """
 
-from unittest.mock import MagicMock, patch
+import time
+from types import SimpleNamespace
 
 import pytest
 from fastapi import FastAPI
-from starlette.requests import Request
 from starlette.testclient import TestClient
 
 from mdb_engine.auth.csrf import (
@@ -25,6 +25,20 @@ from mdb_engine.auth.csrf import (
     validate_csrf_token,
 )
 
+_SECRET = "test-secret"
+
+
+@pytest.fixture(scope="module")
+def unsigned_token():
+    """Plain token, generated once for the module (read-only)."""
+    return generate_csrf_token()
+
+
+@pytest.fixture(scope="module")
+def signed_token():
+    """HMAC-signed token, generated once for the module (read-only)."""
+    return generate_csrf_token(secret=_SECRET)
+
 
 class TestTokenGeneration:
     """Tests for CSRF token generation."""
@@ -47,23 +61,19 @@ class TestTokenGeneration:
 
     def test_generated_tokens_are_unique(self):
         """Test that each generated token is unique."""
-        tokens = [generate_csrf_token() for _ in range(10)]
-        assert len(set(tokens)) == 10
+        assert len({generate_csrf_token() for _ in range(10)}) == 10
 
 
 class TestTokenValidation:
     """Tests for CSRF token validation."""
 
-    def test_validate_simple_token(self):
+    def test_validate_simple_token(self, unsigned_token):
         """Test validating a simple token without signature."""
-        token = generate_csrf_token()
-        assert validate_csrf_token(token) is True
+        assert validate_csrf_token(unsigned_token) is True
 
-    def test_validate_signed_token(self):
+    def test_validate_signed_token(self, signed_token):
         """Test validating a signed token."""
-        secret = "test-secret"
-        token = generate_csrf_token(secret=secret)
-        assert validate_csrf_token(token, secret=secret) is True
+        assert validate_csrf_token(signed_token, secret=_SECRET) is True
 
     def test_reject_empty_token(self):
         """Test that empty token is rejected."""
@@ -74,107 +84,116 @@ class TestTokenValidation:
         """Test that short tokens are rejected."""
         assert validate_csrf_token("short") is False
 
-    def test_reject_tampered_signature(self):
+    def test_reject_tampered_signature(self, signed_token):
         """Test that tampered signature is rejected."""
-        secret = "test-secret"
-        token = generate_csrf_token(secret=secret)
         # Tamper with signature
-        parts = token.split(":")
+        parts = signed_token.split(":")
         parts[2] = "tampered123456"
         tampered_token = ":".join(parts)
-        assert validate_csrf_token(tampered_token, secret=secret) is False
+        assert validate_csrf_token(tampered_token, secret=_SECRET) is False
 
-    def test_reject_expired_token(self):
+    def test_reject_expired_token(self, signed_token):
         """Test that expired tokens are rejected."""
-        import time
+        # Validate with very short max_age, as if time had passed
+        assert (
+            validate_csrf_token(signed_token, secret=_SECRET, max_age=1, now=time.time() + 10000)
+            is False
+        )
 
-        secret = "test-secret"
-        token = generate_csrf_token(secret=secret)
 
-        # Validate with very short max_age
-        with patch("mdb_engine.auth.csrf.time") as mock_time:
-            # Simulate time passing
-            mock_time.time.return_value = time.time() + 10000
-            assert validate_csrf_token(token, secret=secret, max_age=1) is False
+@pytest.fixture(scope="module")
+def csrf_app():
+    """Create FastAPI app with CSRF middleware (built once for the module)."""
+    app = FastAPI()
 
+    @app.get("/")
+    def get_root():
+        return {"message": "ok"}
 
-class TestCSRFMiddleware:
-    """Tests for CSRF middleware."""
+    @app.post("/submit")
+    def post_submit():
+        return {"message": "submitted"}
 
-    @pytest.fixture
-    def app(self):
-        """Create FastAPI app with CSRF middleware."""
-        app = FastAPI()
+    @app.get("/exempt")
+    def get_exempt():
+        return {"message": "exempt"}
 
-        @app.get("/")
-        def get_root():
-            return {"message": "ok"}
+    @app.post("/exempt/action")
+    def post_exempt_action():
+        return {"message": "exempt action"}
 
-        @app.post("/submit")
-        def post_submit():
-            return {"message": "submitted"}
+    app.add_middleware(
+        CSRFMiddleware,
+        exempt_routes=["/exempt/*", "/health"],
+    )
 
-        @app.get("/exempt")
-        def get_exempt():
-            return {"message": "exempt"}
+    return app
 
-        @app.post("/exempt/action")
-        def post_exempt_action():
-            return {"message": "exempt action"}
 
-        app.add_middleware(
-            CSRFMiddleware,
-            exempt_routes=["/exempt/*", "/health"],
-        )
+@pytest.fixture(scope="module")
+def csrf_clients(csrf_app):
+    """Strict and ``raise_server_exceptions=False`` clients, shared by the module.
+
+    Entered as context managers so the app's lifespan runs once for the module.
+    """
+    with TestClient(csrf_app) as client, TestClient(
+        csrf_app, raise_server_exceptions=False
+    ) as lenient_client:
+        yield client, lenient_client
 
-        return app
 
-    def test_get_request_sets_cookie(self, app):
+class TestCSRFMiddleware:
+    """Tests for CSRF middleware."""
+
+    @pytest.fixture
+    def client(self, csrf_clients):
+        """Shared strict client with no cookies carried over from earlier tests."""
+        client = csrf_clients[0]
+        client.cookies.clear()
+        return client
+
+    @pytest.fixture
+    def lenient_client(self, csrf_clients):
+        """Shared client that returns server errors as responses, with cookies cleared."""
+        client = csrf_clients[1]
+        client.cookies.clear()
+        return client
+
+    def test_get_request_sets_cookie(self, client):
         """Test that GET requests set CSRF cookie."""
-        client = TestClient(app)
         response = client.get("/")
 
         assert response.status_code == 200
         assert CSRF_COOKIE_NAME in response.cookies
 
-    def test_post_without_token_rejected(self, app):
+    def test_post_without_token_rejected(self, lenient_client):
         """Test that POST without CSRF token is rejected."""
-        client = TestClient(app, raise_server_exceptions=False)
-
         # First get a cookie
-        client.get("/")
+        lenient_client.get("/")
 
         # POST without CSRF header should fail
-        response = client.post("/submit")
+        response = lenient_client.post("/submit")
         assert response.status_code == 403
         assert "CSRF" in response.json()["detail"]
 
-    def test_post_with_valid_token_accepted(self, app):
+    def test_post_with_valid_token_accepted(self, client):
         """Test that POST with valid CSRF token is accepted."""
-        client = TestClient(app)
-
-        # Get CSRF cookie
-        get_response = client.get("/")
-        csrf_token = get_response.cookies.get(CSRF_COOKIE_NAME)
+        # Set the CSRF cookie directly; no GET round trip needed to obtain one
+        csrf_token = generate_csrf_token()
+        client.cookies.set(CSRF_COOKIE_NAME, csrf_token)
 
         # POST with matching header should succeed
-        response = client.post(
-            "/submit",
-            headers={CSRF_HEADER_NAME: csrf_token},
-            cookies={CSRF_COOKIE_NAME: csrf_token},
-        )
+        response = client.post("/submit", headers={CSRF_HEADER_NAME: csrf_token})
         assert response.status_code == 200
 
-    def test_post_with_mismatched_token_rejected(self, app):
+    def test_post_with_mismatched_token_rejected(self, lenient_client):
         """Test that POST with mismatched CSRF token is rejected."""
-        client = TestClient(app, raise_server_exceptions=False)
-
         # Get CSRF cookie
-        get_response = client.get("/")
+        get_response = lenient_client.get("/")
         csrf_token = get_response.cookies.get(CSRF_COOKIE_NAME)
 
         # POST with different header should fail
-        response = client.post(
+        response = lenient_client.post(
             "/submit",
             headers={CSRF_HEADER_NAME: "different-token"},
             cookies={CSRF_COOKIE_NAME: csrf_token},
@@ -182,10 +201,8 @@ class TestCSRFMiddleware:
         assert response.status_code == 403
         assert "CSRF" in response.json()["detail"]
 
-    def test_exempt_route_skipped(self, app):
+    def test_exempt_route_skipped(self, client):
         """Test that exempt routes skip CSRF validation."""
-        client = TestClient(app)
-
         # POST to exempt route should work without token
         response = client.post("/exempt/action")
         assert response.status_code == 200
@@ -226,33 +243,24 @@ class TestGetCSRFToken:
 
     def test_get_from_request_state(self):
         """Test getting token from request state."""
-        request = MagicMock(spec=Request)
-        request.state.csrf_token = "state-token"
-        request.cookies = {}
+        request = SimpleNamespace(state=SimpleNamespace(csrf_token="state-token"), cookies={})
 
         token = get_csrf_token(request)
         assert token == "state-token"
 
     def test_get_from_cookie(self):
         """Test getting token from cookie."""
-        request = MagicMock(spec=Request)
-        request.state = MagicMock()
-        del request.state.csrf_token  # Remove the attribute
-        request.cookies = {CSRF_COOKIE_NAME: "cookie-token"}
-
-        # Mock hasattr to return False for csrf_token
-        with patch(
-            "mdb_engine.auth.csrf.hasattr",
-            side_effect=lambda obj, attr: attr != "csrf_token",
-        ):
-            token = get_csrf_token(request)
-        assert token is not None
+        # Plain stub: request.state has no csrf_token attribute
+        request = SimpleNamespace(
+            state=SimpleNamespace(), cookies={CSRF_COOKIE_NAME: "cookie-token"}
+        )
+
+        token = get_csrf_token(request)
+        assert token == "cookie-token"
 
     def test_generate_new_token(self):
         """Test generating new token when none exists."""
-        request = MagicMock(spec=Request)
-        request.state = MagicMock(spec=[])  # No csrf_token attribute
-        request.cookies = {}
+        request = SimpleNamespace(state=SimpleNamespace(), cookies={})  # No csrf_token
 
         token = get_csrf_token(request)
         assert token is not None
@@ -6,6 +6,7 @@ Tests encryption/decryption, master key management, and edge cases.
 
 import base64
 import secrets
+import sys
 
 import pytest
 
@@ -16,6 +17,38 @@ from mdb_engine.core.encryption import (
 )
 
 
+def _has_aes_acceleration() -> bool:
+    """Whether the CPU advertises AES instructions (assumed yes off Linux)."""
+    if not sys.platform.startswith("linux"):
+        return True
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                # x86 lists CPU flags under "flags", ARM under "Features"
+                if line.startswith(("flags", "Features")):
+                    return "aes" in line.split(":", 1)[1].split()
+    except OSError:
+        pass
+    return True
+
+
+# Without AES instructions a 1MB roundtrip dominates the suite while adding no
+# coverage over 64KB, so shrink the payload on such hosts
+_LARGE_SECRET_SIZE = 1024 * 1024 if _has_aes_acceleration() else 64 * 1024
+
+
+@pytest.fixture(scope="session")
+def master_keys():
+    """Two distinct raw master keys, generated once per session (read-only)."""
+    return tuple(secrets.token_bytes(AES_KEY_SIZE) for _ in range(2))
+
+
+@pytest.fixture(scope="session")
+def large_secret():
+    """Large secret (1MB, or 64KB without AES instructions), built once per session."""
+    return "x" * _LARGE_SECRET_SIZE
+
+
 class TestEnvelopeEncryptionService:
     """Test EnvelopeEncryptionService functionality."""
 
@@ -66,94 +99,78 @@ class TestEnvelopeEncryptionService:
         with pytest.raises(ValueError, match="Master key must be"):
             EnvelopeEncryptionService()
 
-    def test_generate_dek(self):
+    def test_generate_dek(self, encryption_service):
         """Test DEK generation."""
-        service = EnvelopeEncryptionService(secrets.token_bytes(AES_KEY_SIZE))
-        dek = service.generate_dek()
+        dek = encryption_service.generate_dek()
         assert isinstance(dek, bytes)
         assert len(dek) == AES_KEY_SIZE
 
-    def test_generate_dek_uniqueness(self):
+    def test_generate_dek_uniqueness(self, encryption_service):
         """Test that generated DEKs are unique."""
-        service = EnvelopeEncryptionService(secrets.token_bytes(AES_KEY_SIZE))
-        dek1 = service.generate_dek()
-        dek2 = service.generate_dek()
+        dek1 = encryption_service.generate_dek()
+        dek2 = encryption_service.generate_dek()
         assert dek1 != dek2
 
-    def test_encrypt_secret(self):
+    def test_encrypt_secret(self, encryption_service):
         """Test secret encryption."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
-
         secret = "my_secret_token"
-        encrypted_secret, encrypted_dek = service.encrypt_secret(secret)
+        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
 
         assert isinstance(encrypted_secret, bytes)
         assert isinstance(encrypted_dek, bytes)
         assert len(encrypted_secret) > 0
         assert len(encrypted_dek) > 0
 
-    def test_decrypt_secret(self):
+    def test_decrypt_secret(self, encryption_service):
         """Test secret decryption."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
-
         secret = "my_secret_token"
-        encrypted_secret, encrypted_dek = service.encrypt_secret(secret)
+        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
 
-        decrypted = service.decrypt_secret(encrypted_secret, encrypted_dek)
+        decrypted = encryption_service.decrypt_secret(encrypted_secret, encrypted_dek)
         assert decrypted == secret
 
-    def test_encrypt_decrypt_roundtrip(self):
-        """Test full encrypt/decrypt cycle."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
-
-        secrets_to_test = [
+    @pytest.mark.parametrize(
+        "secret",
+        [
             "simple_secret",
             "secret_with_special_chars!@#$%^&*()",
             "secret_with_unicode_测试_🎉",
             "very_long_secret_" * 100,
-        ]
-
-        for secret in secrets_to_test:
-            encrypted_secret, encrypted_dek = service.encrypt_secret(secret)
-            decrypted = service.decrypt_secret(encrypted_secret, encrypted_dek)
-            assert decrypted == secret
+        ],
+        ids=["simple", "special_chars", "unicode", "long"],
+    )
+    def test_encrypt_decrypt_roundtrip(self, encryption_service, secret):
+        """Test full encrypt/decrypt cycle."""
+        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
+        decrypted = encryption_service.decrypt_secret(encrypted_secret, encrypted_dek)
+        assert decrypted == secret
 
-    def test_encrypt_different_secrets(self):
+    def test_encrypt_different_secrets(self, encryption_service):
         """Test that different secrets produce different ciphertexts."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
-
         secret1 = "secret1"
         secret2 = "secret2"
 
-        enc1, dek1 = service.encrypt_secret(secret1)
-        enc2, dek2 = service.encrypt_secret(secret2)
+        enc1, dek1 = encryption_service.encrypt_secret(secret1)
+        enc2, dek2 = encryption_service.encrypt_secret(secret2)
 
         # Encrypted values should be different
         assert enc1 != enc2
         assert dek1 != dek2
 
-    def test_decrypt_wrong_dek(self):
+    def test_decrypt_wrong_dek(self, encryption_service):
         """Test that decryption fails with wrong DEK."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
-
         secret = "my_secret"
-        encrypted_secret, encrypted_dek = service.encrypt_secret(secret)
+        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
 
-        # Use wrong DEK
-        wrong_dek = secrets.token_bytes(len(encrypted_dek))
+        # Use wrong DEK (any same-length bytes fail authentication)
+        wrong_dek = b"\xff" * len(encrypted_dek)
 
         with pytest.raises(ValueError, match="Failed to decrypt"):
-            service.decrypt_secret(encrypted_secret, wrong_dek)
+            encryption_service.decrypt_secret(encrypted_secret, wrong_dek)
 
-    def test_decrypt_wrong_master_key(self):
+    def test_decrypt_wrong_master_key(self, master_keys):
         """Test that decryption fails with wrong master key."""
-        master_key1 = secrets.token_bytes(AES_KEY_SIZE)
-        master_key2 = secrets.token_bytes(AES_KEY_SIZE)
+        master_key1, master_key2 = master_keys
 
         service1 = EnvelopeEncryptionService(master_key1)
         service2 = EnvelopeEncryptionService(master_key2)
@@ -165,73 +182,57 @@ class TestEnvelopeEncryptionService:
         with pytest.raises(ValueError, match="Failed to decrypt"):
             service2.decrypt_secret(encrypted_secret, encrypted_dek)
 
-    def test_decrypt_corrupted_data(self):
+    def test_decrypt_corrupted_data(self, encryption_service):
         """Test handling of corrupted encrypted data."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
-
         # Corrupt the encrypted data
         encrypted_secret = b"corrupted_data"
         encrypted_dek = b"corrupted_dek"
 
         with pytest.raises(ValueError, match="Failed to decrypt"):
-            service.decrypt_secret(encrypted_secret, encrypted_dek)
+            encryption_service.decrypt_secret(encrypted_secret, encrypted_dek)
 
-    def test_decrypt_too_short_data(self):
+    def test_decrypt_too_short_data(self, encryption_service):
         """Test handling of data that's too short."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
-
         # Data shorter than nonce size
         encrypted_secret = b"short"
         encrypted_dek = b"short"
 
         with pytest.raises(ValueError, match="too short"):
-            service.decrypt_secret(encrypted_secret, encrypted_dek)
+            encryption_service.decrypt_secret(encrypted_secret, encrypted_dek)
 
-    def test_encrypt_empty_secret(self):
+    def test_encrypt_empty_secret(self, encryption_service):
         """Test handling of empty string secrets."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
-
         secret = ""
-        encrypted_secret, encrypted_dek = service.encrypt_secret(secret)
-        decrypted = service.decrypt_secret(encrypted_secret, encrypted_dek)
+        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
+        decrypted = encryption_service.decrypt_secret(encrypted_secret, encrypted_dek)
         assert decrypted == ""
 
-    def test_encrypt_long_secret(self):
+    def test_encrypt_long_secret(self, encryption_service, large_secret):
         """Test handling of very long secrets."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
+        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(large_secret)
+        decrypted = encryption_service.decrypt_secret(encrypted_secret, encrypted_dek)
+        assert decrypted == large_secret
 
-        # 1MB secret
-        secret = "x" * (1024 * 1024)
-        encrypted_secret, encrypted_dek = service.encrypt_secret(secret)
-        decrypted = service.decrypt_secret(encrypted_secret, encrypted_dek)
-        assert decrypted == secret
-
-    def test_encrypt_special_characters(self):
-        """Test handling of Unicode and special characters."""
-        master_key = secrets.token_bytes(AES_KEY_SIZE)
-        service = EnvelopeEncryptionService(master_key)
-
-        secrets_to_test = [
+    @pytest.mark.parametrize(
+        "secret",
+        [
             "测试",
             "🎉🎊🎈",
             "secret\nwith\nnewlines",
             "secret\twith\ttabs",
             "secret with spaces",
-        ]
-
-        for secret in secrets_to_test:
-            encrypted_secret, encrypted_dek = service.encrypt_secret(secret)
-            decrypted = service.decrypt_secret(encrypted_secret, encrypted_dek)
-            assert decrypted == secret
+        ],
+        ids=["cjk", "emoji", "newlines", "tabs", "spaces"],
+    )
+    def test_encrypt_special_characters(self, encryption_service, secret):
+        """Test handling of Unicode and special characters."""
+        encrypted_secret, encrypted_dek = encryption_service.encrypt_secret(secret)
+        decrypted = encryption_service.decrypt_secret(encrypted_secret, encrypted_dek)
+        assert decrypted == secret
 
-    def test_master_key_rotation(self):
+    def test_master_key_rotation(self, master_keys):
         """Test master key rotation (re-encrypt DEKs)."""
-        master_key1 = secrets.token_bytes(AES_KEY_SIZE)
-        master_key2 = secrets.token_bytes(AES_KEY_SIZE)
+        master_key1, master_key2 = master_keys
 
         service1 = EnvelopeEncryptionService(master_key1)
         service2 = EnvelopeEncryptionService(master_key2)
@@ -250,10 +251,9 @@ class TestEnvelopeEncryptionService:
         decrypted2 = service2.decrypt_secret(new_encrypted_secret, new_encrypted_dek)
         assert decrypted2 == secret
 
-    def test_encrypt_with_custom_master_key(self):
+    def test_encrypt_with_custom_master_key(self, master_keys):
         """Test encryption with custom master key parameter."""
-        master_key1 = secrets.token_bytes(AES_KEY_SIZE)
-        master_key2 = secrets.token_bytes(AES_KEY_SIZE)
+        master_key1, master_key2 = master_keys
 
         service = EnvelopeEncryptionService(master_key1)
 
@@ -8,60 +8,81 @@ Tests the core orchestration engine functionality including:
 - Database scoping
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from unittest.mock import MagicMock, patch
 
 import pytest
+from pymongo.errors import ConnectionFailure
 
 from mdb_engine.core.engine import MongoDBEngine
 from mdb_engine.exceptions import InitializationError
 
 
+class _UnreachableMongoClient:
+    """Client stub whose ``admin.command("ping")`` fails like an unreachable server."""
+
+    class _Admin:
+        async def command(self, *args, **kwargs):
+            raise ConnectionFailure("Connection failed")
+
+    admin = _Admin()
+
+
 class TestMongoDBEngineInitialization:
     """Test MongoDBEngine initialization and lifecycle."""
 
-    @pytest.mark.asyncio
-    async def test_engine_initialization_success(self, mock_mongo_client, mongodb_engine_config):
-        """Test successful engine initialization."""
-        with patch(
+    @pytest.fixture(autouse=True)
+    def _patch_motor_client(self, monkeypatch, mock_mongo_client):
+        """Make every client the connection manager builds the shared mock client."""
+        monkeypatch.setattr(
             "mdb_engine.core.connection.AsyncIOMotorClient",
-            return_value=mock_mongo_client,
-        ):
-            engine = MongoDBEngine(**mongodb_engine_config)
-            await engine.initialize()
-
-            assert engine._initialized is True
-            assert engine.mongo_client is not None
+            lambda *args, **kwargs: mock_mongo_client,
+        )
 
-            await engine.shutdown()
+    async def test_engine_initialization_success(self, mongodb_engine_config):
+        """Test successful engine initialization."""
+        engine = MongoDBEngine(**mongodb_engine_config)
+        await engine.initialize()
 
-    @pytest.mark.asyncio
-    async def test_engine_initialization_failure_connection(self, mongodb_engine_config):
-        """Test engine initialization failure due to connection error."""
-        from pymongo.errors import ConnectionFailure
+        assert engine._initialized is True
+        assert engine.mongo_client is not None
 
-        mock_client = MagicMock()
-        mock_client.admin.command = AsyncMock(side_effect=ConnectionFailure("Connection failed"))
+        await engine.shutdown()
 
-        with patch("mdb_engine.core.connection.AsyncIOMotorClient", return_value=mock_client):
-            engine = MongoDBEngine(**mongodb_engine_config)
+    async def test_engine_initialization_failure_connection(
+        self, monkeypatch, mongodb_engine_config
+    ):
+        """Test engine initialization failure due to connection error."""
+        monkeypatch.setattr(
+            "mdb_engine.core.connection.AsyncIOMotorClient",
+            lambda *args, **kwargs: _UnreachableMongoClient(),
+        )
+        engine = MongoDBEngine(**mongodb_engine_config)
 
-            with pytest.raises(InitializationError) as exc_info:
-                await engine.initialize()
+        with pytest.raises(InitializationError) as exc_info:
+            await engine.initialize()
 
-            assert "Failed to connect to MongoDB" in str(exc_info.value)
-            assert engine._initialized is False
+        assert "Failed to connect to MongoDB" in str(exc_info.value)
+        assert engine._initialized is False
 
-    @pytest.mark.asyncio
     async def test_engine_double_initialization(self, mongodb_engine):
         """Test that double initialization is handled gracefully."""
         # First initialization happens in fixture
         assert mongodb_engine._initialized is True
 
+        registration_manager = mongodb_engine._app_registration_manager
+        mongo_client = mongodb_engine.mongo_client
+
         # Second initialization should be a no-op
-        await mongodb_engine.initialize()
+        with patch("mdb_engine.core.connection.AsyncIOMotorClient") as client_cls:
+            await mongodb_engine.initialize()
+
         assert mongodb_engine._initialized is True
+        client_cls.assert_not_called()
+        # Managers (and the apps registered with them) are kept
+        assert mongodb_engine._app_registration_manager is registration_manager
+        assert mongodb_engine.mongo_client is mongo_client
 
-    @pytest.mark.asyncio
     async def test_engine_shutdown(self, mongodb_engine):
         """Test engine shutdown."""
         assert mongodb_engine._initialized is True
@@ -71,42 +92,33 @@ class TestMongoDBEngineInitialization:
         assert mongodb_engine._initialized is False
         assert len(mongodb_engine._apps) == 0
 
-    @pytest.mark.asyncio
     async def test_engine_shutdown_idempotent(self, mongodb_engine):
         """Test that shutdown is idempotent."""
         await mongodb_engine.shutdown()
         await mongodb_engine.shutdown()  # Should not raise
 
-    @pytest.mark.asyncio
-    async def test_engine_context_manager(self, mock_mongo_client, mongodb_engine_config):
+    async def test_engine_context_manager(self, mongodb_engine_config):
         """Test engine as async context manager."""
-        with patch(
-            "mdb_engine.core.connection.AsyncIOMotorClient",
-            return_value=mock_mongo_client,
-        ):
-            async with MongoDBEngine(**mongodb_engine_config) as engine:
-                assert engine._initialized is True
+        async with MongoDBEngine(**mongodb_engine_config) as engine:
+            assert engine._initialized is True
 
-            # After context exit, should be shut down
-            assert engine._initialized is False
+        # After context exit, should be shut down
+        assert engine._initialized is False
 
 
 class TestMongoDBEngineProperties:
     """Test MongoDBEngine property accessors."""
 
-    @pytest.mark.asyncio
     async def test_mongo_client_property_uninitialized(self, uninitialized_mongodb_engine):
         """Test accessing mongo_client before initialization raises error."""
         with pytest.raises(RuntimeError, match="not initialized"):
             _ = uninitialized_mongodb_engine.mongo_client
 
-    @pytest.mark.asyncio
     async def test_mongo_db_property_removed(self, mongodb_engine):
         """Test that mongo_db property is no longer accessible."""
         with pytest.raises(AttributeError, match="mongo_db"):
             _ = mongodb_engine.mongo_db
 
-    @pytest.mark.asyncio
     async def test_mongo_client_property_initialized(self, mongodb_engine):
         """Test accessing mongo_client after initialization."""
         client = mongodb_engine.mongo_client
@@ -116,7 +128,6 @@ class TestMongoDBEngineProperties:
 class TestMongoDBEngineScopedDatabase:
     """Test scoped database wrapper creation."""
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_success(self, mongodb_engine):
         """Test successful scoped database creation."""
         scoped_db = mongodb_engine.get_scoped_db("test_app")
@@ -125,7 +136,6 @@ class TestMongoDBEngineScopedDatabase:
         assert scoped_db._read_scopes == ["test_app"]
         assert scoped_db._write_scope == "test_app"
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_custom_scopes(self, mongodb_engine, sample_manifest):
         """Test scoped database with custom read/write scopes."""
         # Register app with read_scopes including app1 and app2
@@ -162,7 +172,6 @@ class TestMongoDBEngineScopedDatabase:
         assert scoped_db._read_scopes == ["app1", "app2"]
         assert scoped_db._write_scope == "app1"
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_has_validators_and_limiters(self, mongodb_engine):
         """Test that scoped database has query validators and resource limiters."""
         scoped_db = mongodb_engine.get_scoped_db("test_app")
@@ -173,7 +182,6 @@ class TestMongoDBEngineScopedDatabase:
         assert scoped_db._query_validator is not None
         assert scoped_db._resource_limiter is not None
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_collections_have_validators(
         self, mongodb_engine, mock_mongo_database
     ):
@@ -198,7 +206,6 @@ class TestMongoDBEngineScopedDatabase:
             assert collection._query_validator is scoped_db._query_validator
             assert collection._resource_limiter is scoped_db._resource_limiter
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_security_features_work(self, mongodb_engine, mock_mongo_database):
         """Test that security features work end-to-end through engine."""
         from motor.motor_asyncio import AsyncIOMotorCollection
@@ -220,13 +227,11 @@ class TestMongoDBEngineScopedDatabase:
             with pytest.raises(QueryValidationError, match="Dangerous operator"):
                 collection.find({"$where": "true"})
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_uninitialized(self, uninitialized_mongodb_engine):
         """Test getting scoped db before initialization raises error."""
         with pytest.raises(RuntimeError, match="not initialized"):
             uninitialized_mongodb_engine.get_scoped_db("test_app")
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_auto_index_disabled(self, mongodb_engine):
         """Test scoped database with auto_index disabled."""
         scoped_db = mongodb_engine.get_scoped_db("test_app", auto_index=False)
@@ -237,7 +242,6 @@ class TestMongoDBEngineScopedDatabase:
 class TestMongoDBEngineManifestValidation:
     """Test manifest validation functionality."""
 
-    @pytest.mark.asyncio
     async def test_validate_manifest_valid(self, mongodb_engine, sample_manifest):
         """Test validation of a valid manifest."""
         is_valid, error, paths = await mongodb_engine.validate_manifest(sample_manifest)
@@ -246,7 +250,6 @@ class TestMongoDBEngineManifestValidation:
         assert error is None
         assert paths is None
 
-    @pytest.mark.asyncio
     async def test_validate_manifest_invalid(self, mongodb_engine, invalid_manifest):
         """Test validation of an invalid manifest."""
         is_valid, error, paths = await mongodb_engine.validate_manifest(invalid_manifest)
@@ -256,11 +259,8 @@ class TestMongoDBEngineManifestValidation:
         assert paths is not None
         assert len(paths) > 0
 
-    @pytest.mark.asyncio
     async def test_load_manifest_from_file(self, mongodb_engine, tmp_path, sample_manifest):
         """Test loading manifest from file."""
-        import json
-
         manifest_file = tmp_path / "manifest.json"
         manifest_file.write_text(json.dumps(sample_manifest))
 
@@ -269,7 +269,6 @@ class TestMongoDBEngineManifestValidation:
         assert loaded["slug"] == sample_manifest["slug"]
         assert loaded["name"] == sample_manifest["name"]
 
-    @pytest.mark.asyncio
     async def test_load_manifest_file_not_found(self, mongodb_engine, tmp_path):
         """Test loading non-existent manifest file."""
         manifest_file = tmp_path / "nonexistent.json"
@@ -277,14 +276,12 @@ class TestMongoDBEngineManifestValidation:
         with pytest.raises(FileNotFoundError):
             await mongodb_engine.load_manifest(manifest_file)
 
-    @pytest.mark.asyncio
     async def test_validate_manifest_not_initialized(self):
         """Test validate_manifest raises RuntimeError when not initialized (line 230)."""
         engine = MongoDBEngine(mongo_uri="mongodb://localhost:27017", db_name="test_db")
         with pytest.raises(RuntimeError, match="not initialized"):
             await engine.validate_manifest({})
 
-    @pytest.mark.asyncio
     async def test_load_manifest_not_initialized(self):
         """Test load_manifest raises RuntimeError when not initialized (line 250)."""
         engine = MongoDBEngine(mongo_uri="mongodb://localhost:27017", db_name="test_db")
@@ -295,7 +292,6 @@ class TestMongoDBEngineManifestValidation:
 class TestMongoDBEngineGetScopedDbSecurity:
     """Test security validation in get_scoped_db."""
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_validates_read_scopes(self, mongodb_engine):
         """Test that get_scoped_db validates read_scopes."""
         await mongodb_engine.initialize()
@@ -315,7 +311,6 @@ class TestMongoDBEngineGetScopedDbSecurity:
         with pytest.raises(ValueError, match="Invalid app slug"):
             mongodb_engine.get_scoped_db("test_app", read_scopes=[None])
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_validates_write_scope(self, mongodb_engine):
         """Test that get_scoped_db validates write_scope."""
         await mongodb_engine.initialize()
@@ -328,7 +323,6 @@ class TestMongoDBEngineGetScopedDbSecurity:
         db = mongodb_engine.get_scoped_db("test_app", write_scope=None)
         assert db is not None
 
-    @pytest.mark.asyncio
     async def test_get_scoped_db_valid_scopes(self, mongodb_engine, sample_manifest):
         """Test that get_scoped_db works with valid scopes."""
         await mongodb_engine.initialize()
@@ -366,7 +360,6 @@ class TestMongoDBEngineGetScopedDbSecurity:
 class TestMongoDBEngineTenantRegistration:
     """Test app registration functionality."""
 
-    @pytest.mark.asyncio
     async def test_register_app_success(self, mongodb_engine, sample_manifest):
         """Test successful app registration."""
         result = await mongodb_engine.register_app(sample_manifest, create_indexes=False)
@@ -375,7 +368,6 @@ class TestMongoDBEngineTenantRegistration:
         assert sample_manifest["slug"] in mongodb_engine._apps
         assert mongodb_engine.get_app(sample_manifest["slug"]) == sample_manifest
 
-    @pytest.mark.asyncio
     async def test_register_app_missing_slug(self, mongodb_engine, sample_manifest):
         """Test registration with missing slug."""
         manifest_no_slug = {k: v for k, v in sample_manifest.items() if k != "slug"}
@@ -385,7 +377,6 @@ class TestMongoDBEngineTenantRegistration:
         assert result is False
         assert len(mongodb_engine._apps) == 0
 
-    @pytest.mark.asyncio
     async def test_register_app_invalid_manifest(self, mongodb_engine, invalid_manifest):
         """Test registration with invalid manifest."""
         result = await mongodb_engine.register_app(invalid_manifest)
@@ -393,13 +384,11 @@ class TestMongoDBEngineTenantRegistration:
         assert result is False
         assert len(mongodb_engine._apps) == 0
 
-    @pytest.mark.asyncio
     async def test_register_app_uninitialized(self, uninitialized_mongodb_engine, sample_manifest):
         """Test registration before initialization raises error."""
         with pytest.raises(RuntimeError, match="not initialized"):
             await uninitialized_mongodb_engine.register_app(sample_manifest)
 
-    @pytest.mark.asyncio
     async def test_get_app(self, mongodb_engine, sample_manifest):
         """Test getting registered app."""
         await mongodb_engine.register_app(sample_manifest, create_indexes=False)
@@ -408,13 +397,11 @@ class TestMongoDBEngineTenantRegistration:
         assert app is not None
         assert app["slug"] == sample_manifest["slug"]
 
-    @pytest.mark.asyncio
     async def test_get_app_not_found(self, mongodb_engine):
         """Test getting non-existent app."""
         app = mongodb_engine.get_app("nonexistent")
         assert app is None
 
-    @pytest.mark.asyncio
     async def test_list_apps(self, mongodb_engine, sample_manifest):
         """Test listing all apps."""
         assert len(mongodb_engine.list_apps()) == 0
@@ -429,7 +416,6 @@ class TestMongoDBEngineTenantRegistration:
 class TestMongoDBEngineWebSocket:
     """Test WebSocket functionality."""
 
-    @pytest.mark.asyncio
     async def test_get_websocket_config_with_config(self, mongodb_engine):
         """Test getting WebSocket config when available."""
         # Mock service initializer with websocket config
@@ -439,20 +425,17 @@ class TestMongoDBEngineWebSocket:
         config = mongodb_engine.get_websocket_config("test_app")
         assert config == websocket_config
 
-    @pytest.mark.asyncio
     async def test_get_websocket_config_no_config(self, mongodb_engine):
         """Test getting WebSocket config when not configured."""
         config = mongodb_engine.get_websocket_config("nonexistent_app")
         assert config is None
 
-    @pytest.mark.asyncio
     async def test_get_websocket_config_uninitialized(self, uninitialized_mongodb_engine):
         """Test getting WebSocket config before initialization."""
         # When uninitialized, _service_initializer is None, so should return None
         config = uninitialized_mongodb_engine.get_websocket_config("test_app")
         assert config is None
 
-    @pytest.mark.asyncio
     async def test_register_websocket_routes_no_config(self, mongodb_engine):
         """Test registering WebSocket routes when no config exists."""
         mock_app = MagicMock()
@@ -461,7 +444,6 @@ class TestMongoDBEngineWebSocket:
         # Should not have called any FastAPI methods
         assert not hasattr(mock_app, "include_router") or not mock_app.include_router.called
 
-    @pytest.mark.asyncio
     async def test_register_websocket_routes_import_error(self, mongodb_engine):
         """Test registering WebSocket routes when FastAPI is not available."""
         websocket_config = {"endpoint1": {"path": "/ws"}}
@@ -489,7 +471,6 @@ class TestMongoDBEngineWebSocket:
             elif "mdb_engine.routing.websockets" in sys.modules:
                 del sys.modules["mdb_engine.routing.websockets"]
 
-    @pytest.mark.asyncio
     async def test_register_websocket_routes_success(self, mongodb_engine):
         """Test successful WebSocket route registration."""
         websocket_config = {
@@ -516,7 +497,6 @@ class TestMongoDBEngineWebSocket:
                 mock_router.websocket.assert_called_once()
                 mock_app.include_router.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_register_websocket_routes_auth_configs(self, mongodb_engine, sample_manifest):
         """Test WebSocket route registration with different auth config formats."""
         # Register app first
@@ -526,9 +506,9 @@ class TestMongoDBEngineWebSocket:
         websocket_config_nested = {
             "endpoint1": {"path": "/ws/endpoint1", "auth": {"required": False}}
         }
-        mongodb_engine._service_initializer._websocket_configs[
-            "test_experiment"
-        ] = websocket_config_nested
+        mongodb_engine._service_initializer._websocket_configs["test_experiment"] = (
+            websocket_config_nested
+        )
 
         mock_app = MagicMock()
         mock_app.routes = []
@@ -547,9 +527,9 @@ class TestMongoDBEngineWebSocket:
 
         # Test top-level require_auth (backward compatibility)
         websocket_config_top_level = {"endpoint2": {"path": "/ws/endpoint2", "require_auth": False}}
-        mongodb_engine._service_initializer._websocket_configs[
-            "test_experiment"
-        ] = websocket_config_top_level
+        mongodb_engine._service_initializer._websocket_configs["test_experiment"] = (
+            websocket_config_top_level
+        )
 
         with patch(
             "mdb_engine.routing.websockets.create_websocket_endpoint",
@@ -560,7 +540,6 @@ class TestMongoDBEngineWebSocket:
                 call_kwargs = mock_create.call_args[1]
                 assert call_kwargs["require_auth"] is False
 
-    @pytest.mark.asyncio
     async def test_register_websocket_routes_handler_creation_error(self, mongodb_engine):
         """Test WebSocket route registration when handler creation fails."""
         websocket_config = {"endpoint1": {"path": "/ws"}}
@@ -576,7 +555,6 @@ class TestMongoDBEngineWebSocket:
             with pytest.raises(ValueError, match="Handler creation failed"):
                 mongodb_engine.register_websocket_routes(mock_app, "test_app")
 
-    @pytest.mark.asyncio
     async def test_register_websocket_routes_registration_error(self, mongodb_engine):
         """Test WebSocket route registration when FastAPI registration fails."""
         websocket_config = {"endpoint1": {"path": "/ws"}}
@@ -602,7 +580,6 @@ class TestMongoDBEngineWebSocket:
 class TestMongoDBEngineAppManagement:
     """Test app management functionality."""
 
-    @pytest.mark.asyncio
     async def test_reload_apps_success(self, mongodb_engine, sample_manifest):
         """Test successfully reloading apps from database."""
         # First register an app
@@ -614,13 +591,11 @@ class TestMongoDBEngineAppManagement:
             count = await mongodb_engine.reload_apps()
             assert count == 1
 
-    @pytest.mark.asyncio
     async def test_reload_apps_uninitialized(self, uninitialized_mongodb_engine):
         """Test reloading apps before initialization raises error."""
         with pytest.raises(RuntimeError, match="not initialized"):
             await uninitialized_mongodb_engine.reload_apps()
 
-    @pytest.mark.asyncio
     async def test_get_manifest_async(self, mongodb_engine, sample_manifest):
         """Test async get_manifest method."""
         await mongodb_engine.register_app(sample_manifest, create_indexes=False)
@@ -629,7 +604,6 @@ class TestMongoDBEngineAppManagement:
         assert manifest is not None
         assert manifest["slug"] == "test_experiment"
 
-    @pytest.mark.asyncio
     async def test_get_manifest_uninitialized(self, uninitialized_mongodb_engine):
         """Test getting manifest before initialization raises error."""
         with pytest.raises(RuntimeError, match="not initialized"):
@@ -639,13 +613,11 @@ class TestMongoDBEngineAppManagement:
 class TestMongoDBEngineServiceAccessors:
     """Test service accessor methods."""
 
-    @pytest.mark.asyncio
     async def test_get_database_removed(self, mongodb_engine):
         """Test that get_database method is no longer accessible."""
         with pytest.raises(AttributeError, match="get_database"):
             _ = mongodb_engine.get_database()
 
-    @pytest.mark.asyncio
     async def test_get_memory_service_with_service(self, mongodb_engine):
         """Test getting memory service when available."""
         mock_service = MagicMock()
@@ -655,13 +627,11 @@ class TestMongoDBEngineServiceAccessors:
         service = mongodb_engine.get_memory_service("test_app")
         assert service == mock_service
 
-    @pytest.mark.asyncio
     async def test_get_memory_service_no_service(self, mongodb_engine):
         """Test getting memory service when not configured."""
         service = mongodb_engine.get_memory_service("nonexistent_app")
         assert service is None
 
-    @pytest.mark.asyncio
     async def test_get_memory_service_uninitialized(self, uninitialized_mongodb_engine):
         """Test getting memory service before initialization."""
         # When uninitialized, _service_initializer is None, so should return None
@@ -672,7 +642,6 @@ class TestMongoDBEngineServiceAccessors:
 class TestMongoDBEngineHealthMetrics:
     """Test health status and metrics functionality."""
 
-    @pytest.mark.asyncio
     async def test_get_health_status_success(self, mongodb_engine):
         """Test getting health status."""
         with patch(
@@ -686,7 +655,6 @@ class TestMongoDBEngineHealthMetrics:
                 health = await mongodb_engine.get_health_status()
                 assert health is not None
 
-    @pytest.mark.asyncio
     async def test_get_health_status_with_pool_metrics(self, mongodb_engine):
         """Test health status with pool metrics available."""
         mock_health_result = MagicMock()
@@ -712,7 +680,6 @@ class TestMongoDBEngineHealthMetrics:
                         health = await mongodb_engine.get_health_status()
                         assert health is not None
 
-    @pytest.mark.asyncio
     async def test_get_health_status_pool_degraded(self, mongodb_engine):
         """Test health status with degraded pool."""
         mock_health_result = MagicMock()
@@ -738,7 +705,6 @@ class TestMongoDBEngineHealthMetrics:
                         health = await mongodb_engine.get_health_status()
                         assert health is not None
 
-    @pytest.mark.asyncio
     async def test_get_health_status_no_pool_metrics(self, mongodb_engine):
         """Test health status when pool metrics are not available."""
         mock_health_result = MagicMock()
@@ -772,7 +738,6 @@ class TestMongoDBEngineHealthMetrics:
                     if connection_module:
                         sys.modules["mdb_engine.database.connection"] = connection_module
 
-    @pytest.mark.asyncio
     async def test_get_metrics(self, mongodb_engine):
         """Test getting metrics summary."""
         mock_collector = MagicMock()
@@ -788,7 +753,6 @@ class TestMongoDBEngineHealthMetrics:
             assert isinstance(metrics, dict)
             assert len(metrics) > 0
 
-    @pytest.mark.asyncio
     async def test_get_manifest_not_initialized(self):
         """Test get_manifest raises RuntimeError when not initialized."""
         engine = MongoDBEngine(mongo_uri="mongodb://localhost:27017", db_name="test_db")
@@ -796,7 +760,6 @@ class TestMongoDBEngineHealthMetrics:
         with pytest.raises(RuntimeError, match="not initialized"):
             await engine.get_manifest("test_app")
 
-    @pytest.mark.asyncio
     async def test_get_database_not_initialized(self):
         """Test get_database is no longer accessible."""
         engine = MongoDBEngine(mongo_uri="mongodb://localhost:27017", db_name="test_db")
@@ -804,7 +767,6 @@ class TestMongoDBEngineHealthMetrics:
         with pytest.raises(AttributeError, match="get_database"):
             engine.get_database()
 
-    @pytest.mark.asyncio
     async def test_get_memory_service_not_initialized(self):
         """Test get_memory_service when not initialized."""
         engine = MongoDBEngine(mongo_uri="mongodb://localhost:27017", db_name="test_db")
@@ -813,14 +775,12 @@ class TestMongoDBEngineHealthMetrics:
         result = engine.get_memory_service("test_app")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_register_app_not_initialized(self, sample_manifest):
         """Test register_app raises RuntimeError when not initialized."""
         engine = MongoDBEngine(mongo_uri="mongodb://localhost:27017", db_name="test_db")
         with pytest.raises(RuntimeError, match="not initialized"):
             await engine.register_app(sample_manifest)
 
-    @pytest.mark.asyncio
     async def test_reload_apps_not_initialized(self):
         """Test reload_apps raises RuntimeError when not initialized."""
         engine = MongoDBEngine(mongo_uri="mongodb://localhost:27017", db_name="test_db")
@@ -846,7 +806,6 @@ class TestMongoDBEngineHealthMetrics:
         with pytest.raises(RuntimeError, match="not initialized"):
             engine.list_apps()
 
-    @pytest.mark.asyncio
     async def test_register_websocket_routes_auth_from_app_config(
         self, mongodb_engine, sample_manifest
     ):
@@ -875,7 +834,6 @@ class TestMongoDBEngineHealthMetrics:
                 call_kwargs = mock_create.call_args[1]
                 assert call_kwargs["require_auth"] is False
 
-    @pytest.mark.asyncio
     async def test_get_health_status_pool_metrics_with_config(self, mongodb_engine):
         """Test health status with pool metrics that need config added (lines 696-707)."""
         mock_health_result = MagicMock()
@@ -920,7 +878,6 @@ class TestMongoDBEngineHealthMetrics:
                                 assert "max_pool_size" in final_metrics
                                 assert "min_pool_size" in final_metrics
 
-    @pytest.mark.asyncio
     async def test_context_manager_sync(self, mongodb_engine):
         """Test synchronous context manager."""
         # __enter__ returns self
@@ -931,7 +888,6 @@ class TestMongoDBEngineHealthMetrics:
         result = mongodb_engine.__exit__(None, None, None)
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_health_status_pool_import_error(self, mongodb_engine):
         """Test health status when pool metrics import fails (line 730-731)."""
         mock_health_result = MagicMock()
@@ -960,7 +916,6 @@ class TestMongoDBEngineHealthMetrics:
                     if original_connection:
                         sys.modules["mdb_engine.database.connection"] = original_connection
 
-    @pytest.mark.asyncio
     async def test_get_health_status_import_error_handled(self, mongodb_engine):
         """Test get_health_status handles ImportError when registering pool check."""
         from mdb_engine.observability.health import HealthCheckResult, HealthStatus
@@ -1007,7 +962,6 @@ class TestMongoDBEngineHealthMetrics:
                     elif "mdb_engine.database.connection" in sys.modules:
                         del sys.modules["mdb_engine.database.connection"]
 
-    @pytest.mark.asyncio
     async def test_get_health_status_pool_check_import_error(self, mongodb_engine):
         """Test get_health_status handles ImportError when pool check import fails."""
         from mdb_engine.observability.health import HealthCheckResult, HealthStatus
@@ -1056,7 +1010,6 @@ class TestMongoDBEngineHealthMetrics:
 class TestMongoDBEngineCallbackErrors:
     """Test error handling in register_app callbacks."""
 
-    @pytest.mark.asyncio
     async def test_register_app_index_callback_error(self, mongodb_engine, sample_manifest):
         """Test handling index creation callback errors."""
         # Mock index manager to raise error
@@ -1070,7 +1023,6 @@ class TestMongoDBEngineCallbackErrors:
             # Registration should succeed even if callbacks fail
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_register_app_seed_callback_error(self, mongodb_engine, sample_manifest):
         """Test handling seeding callback errors."""
         manifest_with_seed = {
@@ -1086,7 +1038,6 @@ class TestMongoDBEngineCallbackErrors:
         # Registration should succeed even if seeding has issues (it's handled internally)
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_register_app_memory_callback_error(self, mongodb_engine, sample_manifest):
         """Test handling memory initialization callback errors."""
         manifest_with_memory = {
@@ -1103,7 +1054,6 @@ class TestMongoDBEngineCallbackErrors:
             result = await mongodb_engine.register_app(manifest_with_memory, create_indexes=False)
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_register_app_memory_callback_no_service_initializer(
         self, mongodb_engine, sample_manifest
     ):
@@ -1120,7 +1070,6 @@ class TestMongoDBEngineCallbackErrors:
         # Should not raise, just skip memory initialization
         await mongodb_engine.register_app(manifest_with_memory, create_indexes=False)
 
-    @pytest.mark.asyncio
     async def test_register_app_websocket_callback_error(self, mongodb_engine, sample_manifest):
         """Test handling WebSocket callback errors."""
         manifest_with_websockets = {
@@ -1137,7 +1086,6 @@ class TestMongoDBEngineCallbackErrors:
         # Registration should succeed even if callbacks fail
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_register_app_observability_callback_error(self, mongodb_engine, sample_manifest):
         """Test handling observability callback errors."""
         manifest_with_observability = {
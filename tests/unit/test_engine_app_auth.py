@@ -4,21 +4,16 @@ Unit tests for engine app authentication integration.
 Tests register_app secret generation and get_scoped_db token verification.
 """
 
+import base64
 import os
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from mdb_engine.core.encryption import MASTER_KEY_ENV_VAR, EnvelopeEncryptionService
+from mdb_engine.core.encryption import MASTER_KEY_ENV_VAR
 from mdb_engine.core.engine import MongoDBEngine
 
 
-@pytest.fixture
-def master_key():
-    """Generate a test master key."""
-    return EnvelopeEncryptionService.generate_master_key()
-
-
 @pytest.fixture
 async def mongodb_engine_with_secrets(master_key, mock_mongo_client):
     """Create MongoDBEngine with encryption enabled."""
@@ -44,7 +39,6 @@ class TestEngineAppAuthentication:
     ):
         """Test that register_app generates and stores secret."""
         engine = mongodb_engine_with_secrets
-        await engine.initialize()
 
         # Mock the secrets collection BEFORE register_app
         secrets_collection = engine._app_secrets_manager._secrets_collection
@@ -62,7 +56,6 @@ class TestEngineAppAuthentication:
     ):
         """Test that secret is stored encrypted."""
         engine = mongodb_engine_with_secrets
-        await engine.initialize()
 
         # Mock the secrets collection BEFORE register_app
         secrets_collection = engine._app_secrets_manager._secrets_collection
@@ -82,7 +75,6 @@ class TestEngineAppAuthentication:
     ):
         """Test that get_scoped_db requires token when app has stored secret."""
         engine = mongodb_engine_with_secrets
-        await engine.initialize()
 
         # Register app (creates secret) - use test_app slug to match test expectations
         manifest = sample_manifest.copy()
@@ -117,7 +109,6 @@ class TestEngineAppAuthentication:
     ):
         """Test that get_scoped_db works with valid token."""
         engine = mongodb_engine_with_secrets
-        await engine.initialize()
 
         # Register app and get the generated secret
         await engine.register_app(sample_manifest)
@@ -135,7 +126,6 @@ class TestEngineAppAuthentication:
     ):
         """Test that get_scoped_db rejects invalid token."""
         engine = mongodb_engine_with_secrets
-        await engine.initialize()
 
         await engine.register_app(sample_manifest)
 
@@ -148,7 +138,6 @@ class TestEngineAppAuthentication:
     ):
         """Test that get_scoped_db uses manifest read_scopes if not provided."""
         engine = mongodb_engine_with_secrets
-        await engine.initialize()
 
         manifest = {
             "slug": "test_app",
@@ -174,7 +163,6 @@ class TestEngineAppAuthentication:
     ):
         """Test that get_scoped_db validates requested read_scopes."""
         engine = mongodb_engine_with_secrets
-        await engine.initialize()
 
         manifest = {
             "slug": "test_app",
@@ -201,7 +189,6 @@ class TestEngineAppAuthentication:
     async def test_register_app_extracts_data_access(self, mongodb_engine_with_secrets, master_key):
         """Test that register_app extracts data_access from manifest."""
         engine = mongodb_engine_with_secrets
-        await engine.initialize()
 
         manifest = {
             "slug": "test_app",
@@ -226,7 +213,6 @@ class TestEngineAppAuthentication:
     async def test_register_app_warns_missing_apps(self, mongodb_engine_with_secrets, master_key):
         """Test that register_app warns if referenced apps don't exist."""
         engine = mongodb_engine_with_secrets
-        await engine.initialize()
 
         manifest = {
             "slug": "test_app",
@@ -243,3 +229,43 @@ class TestEngineAppAuthentication:
         # Should still register (just warn)
         result = await engine.register_app(manifest)
         assert result is True
+
+    async def test_get_scoped_db_async_verifies_every_call(self, mongodb_engine_with_secrets):
+        """Test that each call re-verifies the token and builds a fresh wrapper."""
+        engine = mongodb_engine_with_secrets
+        manager = engine._app_secrets_manager
+        manager.verify_app_secret = AsyncMock(return_value=True)
+
+        first = await engine.get_scoped_db_async("test_app", app_token="token")
+        second = await engine.get_scoped_db_async("test_app", app_token="token")
+
+        assert first is not second
+        assert manager.verify_app_secret.await_count == 2
+
+    async def test_get_scoped_db_async_rejects_token_rotated_elsewhere(
+        self, mongodb_engine_with_secrets
+    ):
+        """Test that a rotation made outside this engine revokes the old token."""
+        engine = mongodb_engine_with_secrets
+        manager = engine._app_secrets_manager
+        encryption = manager._encryption_service
+
+        def stored_doc(secret):
+            encrypted_secret, encrypted_dek = encryption.encrypt_secret(secret)
+            return {
+                "_id": "test_app",
+                "encrypted_secret": base64.b64encode(encrypted_secret).decode(),
+                "encrypted_dek": base64.b64encode(encrypted_dek).decode(),
+            }
+
+        find_one = manager._secrets_collection.find_one = AsyncMock(
+            return_value=stored_doc("old_secret")
+        )
+        await engine.get_scoped_db_async("test_app", app_token="old_secret")
+
+        # Another process rotates the secret directly in the database
+        find_one.return_value = stored_doc("new_secret")
+
+        with pytest.raises(ValueError, match="Invalid app token"):
+            await engine.get_scoped_db_async("test_app", app_token="old_secret")
+        await engine.get_scoped_db_async("test_app", app_token="new_secret")
@@ -13,6 +13,8 @@ import pytest
 from mdb_engine.core.manifest import (
     ManifestParser,
     ManifestValidator,
+    _get_schema_validator,
+    get_schema_for_version,
     get_schema_version,
     migrate_manifest,
     validate_index_definition,
@@ -111,6 +113,19 @@ class TestManifestValidator:
         ManifestValidator.clear_cache()
         # Should not raise
 
+    def test_schema_validator_compiled_once(self):
+        """Test that each schema's validator is built once and reused."""
+        schema = get_schema_for_version("2.0")
+        assert _get_schema_validator(schema) is _get_schema_validator(schema)
+
+    def test_invalid_manifest_uncached(self, invalid_manifest):
+        """Test the compiled validator reports errors when the result cache is bypassed."""
+        is_valid, error, paths = ManifestValidator.validate(invalid_manifest, use_cache=False)
+
+        assert is_valid is False
+        assert error
+        assert paths
+
 
 class TestManifestParser:
     """Test ManifestParser class."""
@@ -5,6 +5,7 @@ Tests cover:
 - Entropy calculation
 - Common password detection
 - Password strength validation with new options
+- Configurable bcrypt work factor
 """
 
 from unittest.mock import AsyncMock, patch
@@ -18,6 +19,12 @@ from mdb_engine.auth.utils import (
     validate_password_strength,
     validate_password_strength_async,
 )
+from mdb_engine.config import (
+    BCRYPT_ROUNDS_ENV_VAR,
+    DEFAULT_BCRYPT_ROUNDS,
+    MIN_BCRYPT_ROUNDS,
+    get_bcrypt_rounds,
+)
 
 
 class TestEntropyCalculation:
@@ -268,3 +275,28 @@ class TestValidatePasswordStrengthAsync:
 
         is_valid, errors = await validate_password_strength_async("Password1", config=config)
         assert is_valid is True
+
+
+class TestBcryptRounds:
+    """Tests for the configurable bcrypt work factor."""
+
+    def test_test_suite_uses_minimum(self):
+        """Test that the autouse fixture lowers the cost for tests."""
+        assert get_bcrypt_rounds() == MIN_BCRYPT_ROUNDS
+
+    @pytest.mark.bcrypt_full_rounds
+    def test_default_without_override(self, monkeypatch):
+        """Test the default work factor when no override is set."""
+        monkeypatch.delenv(BCRYPT_ROUNDS_ENV_VAR, raising=False)
+        assert get_bcrypt_rounds() == DEFAULT_BCRYPT_ROUNDS
+
+    @pytest.mark.parametrize("value, expected", [("6", 6), ("1", 4), ("40", 31), ("abc", 12)])
+    def test_override_is_clamped(self, monkeypatch, value, expected):
+        """Test that overrides are clamped to bcrypt's valid range."""
+        monkeypatch.setenv(BCRYPT_ROUNDS_ENV_VAR, value)
+        assert get_bcrypt_rounds() == expected
+
+    def test_override_ignored_in_production(self, monkeypatch):
+        """Test that production never uses a lowered work factor."""
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        assert get_bcrypt_rounds() == DEFAULT_BCRYPT_ROUNDS